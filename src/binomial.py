@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
@@ -31,11 +32,39 @@ def crr_parameters(r: float, q: float, sigma: float, dt: float) -> tuple[float,
 
 
 def _payoff(stock: np.ndarray, K: float, option_type: str) -> np.ndarray:
-    if option_type.lower() == "call":
-        return np.maximum(stock - K, 0.0)
-    if option_type.lower() == "put":
-        return np.maximum(K - stock, 0.0)
-    raise ValueError("option_type must be 'call' or 'put'.")
+    kind = option_type.lower()
+    if kind == "call":
+        out = np.subtract(stock, K)
+    elif kind == "put":
+        out = np.subtract(K, stock)
+    else:
+        raise ValueError("option_type must be 'call' or 'put'.")
+    return np.maximum(out, 0.0, out=out)
+
+
+def _stock_layer(S0: float, u: float, d: float, step: int) -> np.ndarray:
+    """Return node prices ``S0 * u**j * d**(step - j)`` via a running product."""
+
+    layer = np.full(step + 1, u / d)
+    layer[0] = S0 * d**step
+    return np.cumprod(layer, out=layer)
+
+
+def _crr_backward(values: np.ndarray, p: float, disc: float) -> float:
+    """Roll terminal values back to the root in place and return the root value.
+
+    Each layer overwrites the leading slice of ``values`` so the sweep reuses one
+    buffer (plus one scratch row) instead of allocating a new array per step.
+    """
+
+    scratch = np.empty(values.size - 1)
+    for n in range(values.size - 1, 0, -1):
+        up = np.multiply(values[1 : n + 1], p, out=scratch[:n])
+        layer = values[:n]
+        layer *= 1.0 - p
+        layer += up
+        layer *= disc
+    return float(values[0])
 
 
 def price_european_binomial(
@@ -57,12 +86,61 @@ def price_european_binomial(
     u, d, p = crr_parameters(r=r, q=q, sigma=sigma, dt=dt)
     disc = math.exp(-r * dt)
 
-    j = np.arange(N + 1)
-    stock_terminal = S0 * (u ** j) * (d ** (N - j))
+    stock_terminal = _stock_layer(S0, u, d, N)
     values = _payoff(stock_terminal, K, option_type)
+    return _crr_backward(values, p, disc)
+
 
-    for _ in range(N, 0, -1):
-        values = disc * (p * values[1:] + (1.0 - p) * values[:-1])
+@lru_cache(maxsize=None)
+def _crr_step_kernel() -> Any:
+    """Build (once) the CuPy kernel for one CRR backward-induction layer."""
+
+    try:
+        import cupy as cp
+    except ImportError as exc:
+        raise ImportError("Install cupy to use price_european_binomial_gpu.") from exc
+
+    return cp.ElementwiseKernel(
+        "float64 up, float64 down, float64 p, float64 disc",
+        "float64 out",
+        "out = disc * (p * up + (1.0 - p) * down)",
+        "crr_step",
+    )
+
+
+def price_european_binomial_gpu(
+    S0: float,
+    K: float,
+    r: float,
+    q: float,
+    sigma: float,
+    T: float,
+    N: int,
+    option_type: str,
+) -> float:
+    """Price a European option with a CRR tree whose backward sweep runs on a GPU.
+
+    Requires CuPy and a CUDA device. Kernel-launch overhead dominates for small
+    trees, so this only pays off for very deep trees (N in the thousands); use
+    :func:`price_european_binomial` otherwise.
+    """
+
+    crr_step = _crr_step_kernel()  # Raises a clear ImportError without CuPy.
+    import cupy as cp
+
+    if N <= 0:
+        raise ValueError("N must be positive.")
+
+    dt = T / N
+    u, d, p = crr_parameters(r=r, q=q, sigma=sigma, dt=dt)
+    disc = math.exp(-r * dt)
+
+    # Ping-pong between two device buffers so no thread reads a node another overwrites.
+    values = cp.asarray(_payoff(_stock_layer(S0, u, d, N), K, option_type))
+    scratch = cp.empty_like(values)
+    for n in range(N, 0, -1):
+        crr_step(values[1 : n + 1], values[:n], p, disc, scratch[:n])
+        values, scratch = scratch, values
     return float(values[0])
 
 
@@ -97,30 +175,48 @@ def replication_tree(
     u, d, p = crr_parameters(r=r, q=q, sigma=sigma, dt=dt)
     disc = math.exp(-r * dt)
 
-    stock_layers: list[np.ndarray] = []
-    for step in range(N + 1):
-        j = np.arange(step + 1)
-        stock_layers.append(S0 * (u ** j) * (d ** (step - j)))
-
-    option_layers: list[np.ndarray] = [np.array([]) for _ in range(N + 1)]
-    delta_layers: list[np.ndarray] = [np.array([]) for _ in range(N)]
-    bond_layers: list[np.ndarray] = [np.array([]) for _ in range(N)]
+    # All layers live in flat triangular buffers; layer ``step`` occupies
+    # [offsets[step], offsets[step + 1]) so adjacent layers are contiguous.
+    offsets = [step * (step + 1) // 2 for step in range(N + 2)]
+    stock = np.empty(offsets[N + 1])
+    option = np.empty(offsets[N + 1])
+    delta = np.empty(offsets[N])
+    bond = np.empty(offsets[N])
 
-    option_layers[N] = _payoff(stock_layers[N], K, option_type)
+    for step in range(N + 1):
+        stock[offsets[step] : offsets[step + 1]] = _stock_layer(S0, u, d, step)
+    option[offsets[N] :] = _payoff(stock[offsets[N] :], K, option_type)
 
+    scratch = np.empty(N)
     for step in range(N - 1, -1, -1):
-        next_values = option_layers[step + 1]
-        option_layers[step] = disc * (p * next_values[1:] + (1.0 - p) * next_values[:-1])
-
-        Su = stock_layers[step + 1][1:]
-        Sd = stock_layers[step + 1][:-1]
-        Vu = next_values[1:]
-        Vd = next_values[:-1]
-
-        delta = (Vu - Vd) / (Su - Sd)
-        bond = np.exp(-r * dt) * (Vu - delta * Su)
-        delta_layers[step] = delta
-        bond_layers[step] = bond
+        lo, hi, nxt = offsets[step], offsets[step + 1], offsets[step + 2]
+        Su = stock[hi + 1 : nxt]
+        Sd = stock[hi : nxt - 1]
+        Vu = option[hi + 1 : nxt]
+        Vd = option[hi : nxt - 1]
+        tmp = scratch[: step + 1]
+
+        # Write every layer straight into its slice; ``tmp`` is the only scratch row.
+        opt = option[lo:hi]
+        np.multiply(Vd, 1.0 - p, out=opt)
+        np.multiply(Vu, p, out=tmp)
+        opt += tmp
+        opt *= disc
+
+        dlt = delta[lo:hi]
+        np.subtract(Vu, Vd, out=dlt)
+        np.subtract(Su, Sd, out=tmp)
+        dlt /= tmp
+
+        bnd = bond[lo:hi]
+        np.multiply(dlt, Su, out=bnd)
+        np.subtract(Vu, bnd, out=bnd)
+        bnd *= disc
+
+    stock_layers = [stock[offsets[step] : offsets[step + 1]] for step in range(N + 1)]
+    option_layers = [option[offsets[step] : offsets[step + 1]] for step in range(N + 1)]
+    delta_layers = [delta[offsets[step] : offsets[step + 1]] for step in range(N)]
+    bond_layers = [bond[offsets[step] : offsets[step + 1]] for step in range(N)]
 
     root_price = float(option_layers[0][0])
     root_repl = float(delta_layers[0][0] * S0 + bond_layers[0][0])
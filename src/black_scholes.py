@@ -3,9 +3,27 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 
 import numpy as np
-from scipy.stats import norm
+
+from .utils import norm_cdf, norm_pdf
+
+
+@lru_cache(maxsize=256)
+def _discount_factors(r: float, q: float, T: float) -> tuple[float, float, float]:
+    """Return ``(exp(-rT), exp(-qT), sqrt(T))``, memoized across repeated market inputs."""
+
+    return math.exp(-r * T), math.exp(-q * T), math.sqrt(T)
+
+
+def _is_call(option_type: str) -> bool:
+    kind = option_type.lower()
+    if kind == "call":
+        return True
+    if kind == "put":
+        return False
+    raise ValueError("option_type must be 'call' or 'put'.")
 
 
 def _validate_inputs(S: float, K: float, sigma: float, T: float) -> None:
@@ -19,6 +37,21 @@ def _validate_inputs(S: float, K: float, sigma: float, T: float) -> None:
         raise ValueError("Maturity T must be positive.")
 
 
+def _d1_d2_unchecked(S: float, K: float, r: float, q: float, sigma: float, T: float) -> tuple[float, float]:
+    sqrt_t = _discount_factors(r, q, T)[2]
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    return d1, d2
+
+
+def _price_unchecked(S: float, K: float, r: float, q: float, sigma: float, T: float, is_call: bool) -> float:
+    d1, d2 = _d1_d2_unchecked(S, K, r, q, sigma, T)
+    df_r, df_q, _ = _discount_factors(r, q, T)
+    if is_call:
+        return float(S * df_q * norm_cdf(d1) - K * df_r * norm_cdf(d2))
+    return float(K * df_r * norm_cdf(-d2) - S * df_q * norm_cdf(-d1))
+
+
 def d1_d2(S: float, K: float, r: float, q: float, sigma: float, T: float) -> tuple[float, float]:
     """Compute Black-Scholes d1 and d2 terms.
 
@@ -35,65 +68,91 @@ def d1_d2(S: float, K: float, r: float, q: float, sigma: float, T: float) -> tup
     """
 
     _validate_inputs(S, K, sigma, T)
-    sqrt_t = math.sqrt(T)
-    d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrt_t)
-    d2 = d1 - sigma * sqrt_t
-    return d1, d2
+    return _d1_d2_unchecked(S, K, r, q, sigma, T)
 
 
 def bs_call_price(S: float, K: float, r: float, q: float, sigma: float, T: float) -> float:
     """Return European call price under Black-Scholes assumptions."""
 
-    d1, d2 = d1_d2(S, K, r, q, sigma, T)
-    return float(S * math.exp(-q * T) * norm.cdf(d1) - K * math.exp(-r * T) * norm.cdf(d2))
+    _validate_inputs(S, K, sigma, T)
+    return _price_unchecked(S, K, r, q, sigma, T, True)
 
 
 def bs_put_price(S: float, K: float, r: float, q: float, sigma: float, T: float) -> float:
     """Return European put price under Black-Scholes assumptions."""
 
-    d1, d2 = d1_d2(S, K, r, q, sigma, T)
-    return float(K * math.exp(-r * T) * norm.cdf(-d2) - S * math.exp(-q * T) * norm.cdf(-d1))
+    _validate_inputs(S, K, sigma, T)
+    return _price_unchecked(S, K, r, q, sigma, T, False)
 
 
 def bs_delta(S: float, K: float, r: float, q: float, sigma: float, T: float, option_type: str) -> float:
     """Return Black-Scholes delta for call or put."""
 
+    is_call = _is_call(option_type)
     d1, _ = d1_d2(S, K, r, q, sigma, T)
-    if option_type.lower() == "call":
-        return float(math.exp(-q * T) * norm.cdf(d1))
-    if option_type.lower() == "put":
-        return float(math.exp(-q * T) * (norm.cdf(d1) - 1.0))
-    raise ValueError("option_type must be 'call' or 'put'.")
+    df_q = _discount_factors(r, q, T)[1]
+    if is_call:
+        return float(df_q * norm_cdf(d1))
+    return float(df_q * (norm_cdf(d1) - 1.0))
 
 
 def bs_gamma(S: float, K: float, r: float, q: float, sigma: float, T: float) -> float:
     """Return Black-Scholes gamma."""
 
     d1, _ = d1_d2(S, K, r, q, sigma, T)
-    return float(math.exp(-q * T) * norm.pdf(d1) / (S * sigma * math.sqrt(T)))
+    _, df_q, sqrt_t = _discount_factors(r, q, T)
+    return float(df_q * norm_pdf(d1) / (S * sigma * sqrt_t))
 
 
 def bs_vega(S: float, K: float, r: float, q: float, sigma: float, T: float) -> float:
     """Return Black-Scholes vega per unit volatility."""
 
     d1, _ = d1_d2(S, K, r, q, sigma, T)
-    return float(S * math.exp(-q * T) * norm.pdf(d1) * math.sqrt(T))
+    _, df_q, sqrt_t = _discount_factors(r, q, T)
+    return float(S * df_q * norm_pdf(d1) * sqrt_t)
+
+
+def bs_price_vega(
+    S: float,
+    K: float,
+    r: float,
+    q: float,
+    sigma: float,
+    T: float,
+    option_type: str,
+) -> tuple[float, float]:
+    """Return ``(price, vega)`` from a single evaluation of d1/d2.
+
+    Useful for Newton-type solvers that need both at every iterate.
+    """
+
+    is_call = _is_call(option_type)
+    d1, d2 = d1_d2(S, K, r, q, sigma, T)
+    df_r, df_q, sqrt_t = _discount_factors(r, q, T)
+    disc_spot = S * df_q
+    disc_strike = K * df_r
+    if is_call:
+        price = disc_spot * norm_cdf(d1) - disc_strike * norm_cdf(d2)
+    else:
+        price = disc_strike * norm_cdf(-d2) - disc_spot * norm_cdf(-d1)
+    vega = disc_spot * norm_pdf(d1) * sqrt_t
+    return float(price), float(vega)
 
 
 def put_call_parity_check(S: float, K: float, r: float, q: float, sigma: float, T: float) -> float:
     """Return parity residual C - P - (S e^{-qT} - K e^{-rT})."""
 
-    call = bs_call_price(S, K, r, q, sigma, T)
-    put = bs_put_price(S, K, r, q, sigma, T)
-    rhs = S * math.exp(-q * T) - K * math.exp(-r * T)
+    _validate_inputs(S, K, sigma, T)
+    call = _price_unchecked(S, K, r, q, sigma, T, True)
+    put = _price_unchecked(S, K, r, q, sigma, T, False)
+    df_r, df_q, _ = _discount_factors(r, q, T)
+    rhs = S * df_q - K * df_r
     return float(call - put - rhs)
 
 
 def bs_price(S: float, K: float, r: float, q: float, sigma: float, T: float, option_type: str) -> float:
     """Dispatch helper returning call or put price."""
 
-    if option_type.lower() == "call":
-        return bs_call_price(S, K, r, q, sigma, T)
-    if option_type.lower() == "put":
-        return bs_put_price(S, K, r, q, sigma, T)
-    raise ValueError("option_type must be 'call' or 'put'.")
+    is_call = _is_call(option_type)
+    _validate_inputs(S, K, sigma, T)
+    return _price_unchecked(S, K, r, q, sigma, T, is_call)
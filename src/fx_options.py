@@ -4,9 +4,8 @@ from __future__ import annotations
 
 import math
 
-from scipy.stats import norm
-
 from .implied_vol import implied_vol
+from .utils import norm_cdf
 
 
 def _d1_d2(S: float, K: float, rd: float, rf: float, sigma: float, T: float) -> tuple[float, float]:
@@ -25,14 +24,14 @@ def gk_call_price(S: float, K: float, rd: float, rf: float, sigma: float, T: flo
     """Return FX call price under Garman-Kohlhagen."""
 
     d1, d2 = _d1_d2(S, K, rd, rf, sigma, T)
-    return float(S * math.exp(-rf * T) * norm.cdf(d1) - K * math.exp(-rd * T) * norm.cdf(d2))
+    return S * math.exp(-rf * T) * norm_cdf(d1) - K * math.exp(-rd * T) * norm_cdf(d2)
 
 
 def gk_put_price(S: float, K: float, rd: float, rf: float, sigma: float, T: float) -> float:
     """Return FX put price under Garman-Kohlhagen."""
 
     d1, d2 = _d1_d2(S, K, rd, rf, sigma, T)
-    return float(K * math.exp(-rd * T) * norm.cdf(-d2) - S * math.exp(-rf * T) * norm.cdf(-d1))
+    return K * math.exp(-rd * T) * norm_cdf(-d2) - S * math.exp(-rf * T) * norm_cdf(-d1)
 
 
 def gk_delta(S: float, K: float, rd: float, rf: float, sigma: float, T: float, option_type: str) -> float:
@@ -40,9 +39,9 @@ def gk_delta(S: float, K: float, rd: float, rf: float, sigma: float, T: float, o
 
     d1, _ = _d1_d2(S, K, rd, rf, sigma, T)
     if option_type.lower() == "call":
-        return float(math.exp(-rf * T) * norm.cdf(d1))
+        return math.exp(-rf * T) * norm_cdf(d1)
     if option_type.lower() == "put":
-        return float(math.exp(-rf * T) * (norm.cdf(d1) - 1.0))
+        return math.exp(-rf * T) * (norm_cdf(d1) - 1.0)
     raise ValueError("option_type must be 'call' or 'put'.")
 
 
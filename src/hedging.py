@@ -7,7 +7,7 @@ from typing import Any
 
 import numpy as np
 import pandas as pd
-from scipy.stats import norm
+from scipy.special import ndtr
 
 from .black_scholes import bs_delta, bs_price
 from .metrics import cvar
@@ -38,16 +38,24 @@ def _bs_delta_vectorized(
             return np.where(S < K, -1.0, 0.0)
         raise ValueError("option_type must be 'call' or 'put'.")
 
-    sqrt_tau = math.sqrt(tau)
-    d1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * tau) / (sigma * sqrt_tau)
-    if option_type.lower() == "call":
-        return np.exp(-q * tau) * norm.cdf(d1)
-    if option_type.lower() == "put":
-        return np.exp(-q * tau) * (norm.cdf(d1) - 1.0)
-    raise ValueError("option_type must be 'call' or 'put'.")
+    kind = option_type.lower()
+    if kind not in {"call", "put"}:
+        raise ValueError("option_type must be 'call' or 'put'.")
 
+    # Build d1 -> N(d1) -> delta in a single buffer to avoid per-stage temporaries.
+    sigma_sqrt_tau = sigma * math.sqrt(tau)
+    out = np.divide(S, K)
+    np.log(out, out=out)
+    out += (r - q + 0.5 * sigma * sigma) * tau
+    out /= sigma_sqrt_tau
+    ndtr(out, out=out)
+    if kind == "put":
+        out -= 1.0
+    out *= math.exp(-q * tau)
+    return out
 
-def simulate_delta_hedge_on_paths(
+
+def _hedge_loop(
     paths: np.ndarray,
     K: float,
     r: float,
@@ -56,49 +64,94 @@ def simulate_delta_hedge_on_paths(
     T: float,
     rebalance_every_k_steps: int,
     option_type: str,
-    tx_cost_per_dollar: float = 0.0,
-) -> dict[str, Any]:
-    """Run a short-option delta hedge on provided spot paths.
+    tx_costs: np.ndarray,
+    delta_pos: np.ndarray,
+    cash: np.ndarray,
+) -> None:
+    """Advance hedge positions to maturity, updating ``delta_pos`` and ``cash`` in place.
 
-    Hedging convention:
-    - Short one European option at inception (receive premium).
-    - Hold delta shares to hedge option sensitivity.
-    - Hedging error = final hedged P&L after settling option payoff.
+    ``cash`` has one row per entry of the column vector ``tx_costs``. Hedge ratios
+    do not depend on transaction costs, so each rebalance computes target deltas
+    once and charges every cost level against the same trades.
     """
 
+    n_steps = paths.shape[1] - 1
+    dt = T / n_steps
+    trade = np.empty_like(delta_pos)
+    notional = np.empty_like(delta_pos)
+    cost = np.empty_like(cash)
+
+    # Cash only changes through trades, so accrue interest in one compound factor
+    # between consecutive rebalance dates instead of once per step.
+    growth = math.exp(r * dt * rebalance_every_k_steps)
+    last_step = 0
+    for step in range(rebalance_every_k_steps, n_steps, rebalance_every_k_steps):
+        cash *= growth
+        last_step = step
+
+        S_t = paths[:, step]
+        tau = max(T - step * dt, 1e-12)
+        target_delta = _bs_delta_vectorized(S_t, K, r, q, sigma_model, tau, option_type)
+        np.subtract(target_delta, delta_pos, out=trade)
+        np.multiply(trade, S_t, out=notional)
+        cash -= notional
+        np.abs(notional, out=notional)
+        np.multiply(tx_costs, notional, out=cost)
+        cash -= cost
+        delta_pos[:] = target_delta
+
+    cash *= math.exp(r * dt * (n_steps - last_step))
+
+
+def _hedge_errors(
+    paths: np.ndarray,
+    K: float,
+    r: float,
+    q: float,
+    sigma_model: float,
+    T: float,
+    rebalance_every_k_steps: int,
+    option_type: str,
+    tx_cost_list: list[float],
+) -> np.ndarray:
+    """Return hedging errors with shape (len(tx_cost_list), n_paths)."""
+
     if paths.ndim != 2:
         raise ValueError("paths must have shape (n_paths, n_steps + 1).")
 
-    n_paths, n_cols = paths.shape
-    n_steps = n_cols - 1
-    dt = T / n_steps
+    n_paths = paths.shape[0]
+    tx_costs = np.asarray(tx_cost_list, dtype=float).reshape(-1, 1)
 
     S0 = float(paths[0, 0])
     premium = bs_price(S0, K, r, q, sigma_model, T, option_type)
     delta0 = bs_delta(S0, K, r, q, sigma_model, T, option_type)
 
     delta_pos = np.full(n_paths, delta0, dtype=float)
-    cash = np.full(n_paths, premium - delta0 * S0 - tx_cost_per_dollar * abs(delta0) * S0, dtype=float)
-
-    for step in range(1, n_steps + 1):
-        cash *= math.exp(r * dt)
-        S_t = paths[:, step]
+    cash = np.empty((tx_costs.shape[0], n_paths), dtype=float)
+    cash[:] = premium - delta0 * S0 - tx_costs * abs(delta0) * S0
 
-        is_rebalance = step < n_steps and (step % rebalance_every_k_steps == 0)
-        if is_rebalance:
-            tau = max(T - step * dt, 1e-12)
-            target_delta = _bs_delta_vectorized(S_t, K, r, q, sigma_model, tau, option_type)
-            trade = target_delta - delta_pos
-            cash -= trade * S_t + tx_cost_per_dollar * np.abs(trade) * S_t
-            delta_pos = target_delta
+    _hedge_loop(
+        paths,
+        K,
+        r,
+        q,
+        sigma_model,
+        T,
+        rebalance_every_k_steps,
+        option_type,
+        tx_costs,
+        delta_pos,
+        cash,
+    )
 
     S_T = paths[:, -1]
-    liquidated = cash + delta_pos * S_T - tx_cost_per_dollar * np.abs(delta_pos) * S_T
-    payoff = _payoff(S_T, K, option_type)
-    errors = liquidated - payoff
+    stock_value = delta_pos * S_T
+    liquidated = cash + stock_value - tx_costs * np.abs(stock_value)
+    return liquidated - _payoff(S_T, K, option_type)
 
+
+def _error_stats(errors: np.ndarray) -> dict[str, float]:
     return {
-        "errors": errors,
         "mean_error": float(np.mean(errors)),
         "std_error": float(np.std(errors, ddof=1)),
         "q05": float(np.quantile(errors, 0.05)),
@@ -106,6 +159,39 @@ def simulate_delta_hedge_on_paths(
     }
 
 
+def simulate_delta_hedge_on_paths(
+    paths: np.ndarray,
+    K: float,
+    r: float,
+    q: float,
+    sigma_model: float,
+    T: float,
+    rebalance_every_k_steps: int,
+    option_type: str,
+    tx_cost_per_dollar: float = 0.0,
+) -> dict[str, Any]:
+    """Run a short-option delta hedge on provided spot paths.
+
+    Hedging convention:
+    - Short one European option at inception (receive premium).
+    - Hold delta shares to hedge option sensitivity.
+    - Hedging error = final hedged P&L after settling option payoff.
+    """
+
+    errors = _hedge_errors(
+        paths,
+        K,
+        r,
+        q,
+        sigma_model,
+        T,
+        rebalance_every_k_steps,
+        option_type,
+        [tx_cost_per_dollar],
+    )[0]
+    return {"errors": errors, **_error_stats(errors)}
+
+
 def simulate_delta_hedge_gbm(
     S0: float,
     K: float,
@@ -195,26 +281,24 @@ def hedging_experiment_grid(
 
     rows = []
     for k in rebalance_list:
-        for tx in tx_cost_list:
-            out = simulate_delta_hedge_on_paths(
-                paths=base_paths,
-                K=K,
-                r=r,
-                q=q,
-                sigma_model=sigma,
-                T=T,
-                rebalance_every_k_steps=k,
-                option_type=option_type,
-                tx_cost_per_dollar=tx,
-            )
+        # One pass per rebalance frequency prices every transaction-cost level.
+        errors = _hedge_errors(
+            base_paths,
+            K,
+            r,
+            q,
+            sigma,
+            T,
+            k,
+            option_type,
+            tx_cost_list,
+        )
+        for tx, tx_errors in zip(tx_cost_list, errors):
             rows.append(
                 {
                     "rebalance_every_k_steps": k,
                     "tx_cost_per_dollar": tx,
-                    "mean_error": out["mean_error"],
-                    "std_error": out["std_error"],
-                    "q05": out["q05"],
-                    "q95": out["q95"],
+                    **_error_stats(tx_errors),
                 }
             )
     return pd.DataFrame(rows)
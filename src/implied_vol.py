@@ -7,8 +7,9 @@ from typing import Literal
 
 import numpy as np
 import pandas as pd
+from scipy.special import ndtr
 
-from .black_scholes import bs_price, bs_vega
+from .utils import norm_cdf, norm_pdf
 
 
 Method = Literal["hybrid", "bisection"]
@@ -28,6 +29,75 @@ def _no_arbitrage_bounds(S: float, K: float, r: float, q: float, T: float, optio
     return lower, upper
 
 
+def _initial_sigma(
+    price: float | np.ndarray,
+    disc_spot: float | np.ndarray,
+    disc_strike: float | np.ndarray,
+    T: float | np.ndarray,
+    is_call: bool | np.ndarray,
+    lower: float,
+    upper: float,
+) -> float | np.ndarray:
+    """Corrado-Miller starting point, falling back to the bracket midpoint.
+
+    Puts are mapped to call prices through put-call parity first.
+    """
+
+    call = np.where(is_call, price, price + disc_spot - disc_strike)
+    moneyness = 0.5 * (disc_spot - disc_strike)
+    excess = call - moneyness
+    root = np.sqrt(np.maximum(excess * excess - 4.0 * moneyness * moneyness / math.pi, 0.0))
+    sigma0 = math.sqrt(2.0 * math.pi) / np.sqrt(T) * (excess + root) / (disc_spot + disc_strike)
+    inside = np.isfinite(sigma0) & (sigma0 > lower) & (sigma0 < upper)
+    return np.where(inside, sigma0, 0.5 * (lower + upper))
+
+
+def _bs_price_vega_array(
+    S: float,
+    K: np.ndarray,
+    r: float,
+    q: float,
+    sigma: np.ndarray,
+    T: np.ndarray,
+    is_call: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    sqrt_t = np.sqrt(T)
+    disc_spot = S * np.exp(-q * T)
+    disc_strike = K * np.exp(-r * T)
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    call = disc_spot * ndtr(d1) - disc_strike * ndtr(d2)
+    price = np.where(is_call, call, call - disc_spot + disc_strike)
+    vega = disc_spot * np.exp(-0.5 * d1 * d1) * sqrt_t / math.sqrt(2.0 * math.pi)
+    return price, vega
+
+
+def _bs_price_vega_scalar(
+    log_moneyness: float,
+    carry: float,
+    disc_spot: float,
+    disc_strike: float,
+    sigma: float,
+    T: float,
+    sqrt_t: float,
+    is_call: bool,
+) -> tuple[float, float]:
+    """Scalar twin of :func:`_bs_price_vega_array` with market terms precomputed.
+
+    ``log_moneyness = log(S/K)`` and ``carry = (r - q) T``; only the sigma-dependent
+    part is evaluated, using libm ``erfc``/``exp`` on Python floats.
+    """
+
+    vol_t = sigma * sqrt_t
+    d1 = (log_moneyness + carry + 0.5 * sigma * sigma * T) / vol_t
+    d2 = d1 - vol_t
+    if is_call:
+        price = disc_spot * norm_cdf(d1) - disc_strike * norm_cdf(d2)
+    else:
+        price = disc_strike * norm_cdf(-d2) - disc_spot * norm_cdf(-d1)
+    return price, disc_spot * norm_pdf(d1) * sqrt_t
+
+
 def implied_vol(
     price: float,
     S: float,
@@ -58,6 +128,8 @@ def implied_vol(
 
     if price <= 0:
         raise ValueError("Option price must be positive for implied volatility inversion.")
+    if S <= 0 or K <= 0 or T <= 0:
+        raise ValueError("S, K and T must be positive.")
 
     low_bound, high_bound = _no_arbitrage_bounds(S, K, r, q, T, option_type)
     if not (low_bound - tol <= price <= high_bound + tol):
@@ -65,10 +137,12 @@ def implied_vol(
             f"Price={price:.6f} violates no-arbitrage bounds [{low_bound:.6f}, {high_bound:.6f}]"
         )
 
+    # The Black-Scholes price tends to the no-arbitrage bounds as sigma -> 0 and
+    # sigma -> inf, so the bracket signs follow without pricing at the endpoints.
     low = lower
     high = upper
-    f_low = bs_price(S, K, r, q, low, T, option_type) - price
-    f_high = bs_price(S, K, r, q, high, T, option_type) - price
+    f_low = low_bound - price
+    f_high = high_bound - price
 
     if f_low == 0:
         return low
@@ -77,16 +151,25 @@ def implied_vol(
     if f_low * f_high > 0:
         raise ValueError("Volatility bracket does not contain a root; widen [lower, upper].")
 
-    sigma = 0.5 * (low + high)
+    # Everything except sigma is fixed across iterations, so hoist it.
+    is_call = option_type.lower() == "call"
+    disc_spot = S * math.exp(-q * T)
+    disc_strike = K * math.exp(-r * T)
+    log_moneyness = math.log(S / K)
+    carry = (r - q) * T
+    sqrt_t = math.sqrt(T)
+
+    sigma = float(_initial_sigma(price, disc_spot, disc_strike, T, is_call, low, high))
     for _ in range(max_iter):
-        model_price = bs_price(S, K, r, q, sigma, T, option_type)
+        model_price, vega = _bs_price_vega_scalar(
+            log_moneyness, carry, disc_spot, disc_strike, sigma, T, sqrt_t, is_call
+        )
         diff = model_price - price
         if abs(diff) < tol:
             return float(sigma)
 
         take_newton = method == "hybrid"
         if take_newton:
-            vega = bs_vega(S, K, r, q, sigma, T)
             if vega > 1e-10:
                 sigma_newton = sigma - diff / vega
                 if low < sigma_newton < high:
@@ -100,11 +183,93 @@ def implied_vol(
         sigma = 0.5 * (low + high)
 
         if high - low < tol:
+            if low == lower or high == upper:
+                # Bisection never moved one endpoint: the root lies outside [lower, upper].
+                raise ValueError("Volatility bracket does not contain a root; widen [lower, upper].")
             return float(sigma)
 
     raise RuntimeError("Implied volatility solver did not converge.")
 
 
+def implied_vol_vec(
+    prices: np.ndarray,
+    S: float,
+    K: np.ndarray,
+    r: float,
+    q: float,
+    T: float | np.ndarray,
+    is_call: np.ndarray,
+    method: Method = "hybrid",
+    lower: float = 1e-6,
+    upper: float = 5.0,
+    tol: float = 1e-8,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """Invert Black-Scholes prices to implied volatilities for whole arrays.
+
+    Runs the same Newton/bisection hybrid as :func:`implied_vol`, but on all
+    quotes at once. ``is_call`` is a boolean mask selecting calls over puts and
+    ``T`` may be a scalar or an array broadcastable against ``prices``.
+
+    Quotes that are non-positive, violate no-arbitrage bounds, or fail to
+    converge within ``max_iter`` iterations are returned as NaN.
+    """
+
+    price, K, T, is_call = np.broadcast_arrays(
+        np.asarray(prices, dtype=float),
+        np.asarray(K, dtype=float),
+        np.asarray(T, dtype=float),
+        np.asarray(is_call, dtype=bool),
+    )
+
+    disc_spot = S * np.exp(-q * T)
+    disc_strike = K * np.exp(-r * T)
+    intrinsic = np.where(is_call, disc_spot - disc_strike, disc_strike - disc_spot)
+    low_bound = np.maximum(intrinsic, 0.0)
+    high_bound = np.where(is_call, disc_spot, disc_strike)
+
+    low = np.full(price.shape, lower)
+    high = np.full(price.shape, upper)
+    f_low = low_bound - price
+    f_high = high_bound - price
+
+    valid = (price > 0) & (low_bound - tol <= price) & (price <= high_bound + tol) & (f_low * f_high <= 0)
+    out = np.full(price.shape, np.nan)
+    out[valid & (f_low == 0)] = lower
+    out[valid & (f_high == 0) & (f_low != 0)] = upper
+    active = valid & (f_low != 0) & (f_high != 0)
+
+    sigma = _initial_sigma(price, disc_spot, disc_strike, T, is_call, lower, upper)
+    for _ in range(max_iter):
+        if not active.any():
+            break
+
+        model_price, vega = _bs_price_vega_array(S, K, r, q, sigma, T, is_call)
+        diff = model_price - price
+        converged = active & (np.abs(diff) < tol)
+        out[converged] = sigma[converged]
+        active &= ~converged
+
+        take_newton = np.zeros(price.shape, dtype=bool)
+        if method == "hybrid":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                sigma_newton = sigma - diff / vega
+            take_newton = active & (vega > 1e-10) & (low < sigma_newton) & (sigma_newton < high)
+            sigma = np.where(take_newton, sigma_newton, sigma)
+
+        bisect = active & ~take_newton
+        high = np.where(bisect & (diff > 0), sigma, high)
+        low = np.where(bisect & (diff <= 0), sigma, low)
+        sigma = np.where(bisect, 0.5 * (low + high), sigma)
+
+        narrow = bisect & (high - low < tol)
+        interior = narrow & (low != lower) & (high != upper)
+        out[interior] = sigma[interior]
+        active &= ~narrow
+
+    return out
+
+
 def implied_vol_surface_from_prices(
     prices_df: pd.DataFrame,
     S: float,
@@ -124,18 +289,37 @@ def implied_vol_surface_from_prices(
     if missing:
         raise ValueError(f"Missing required columns: {sorted(missing)}")
 
-    out = prices_df.copy()
-    out["implied_vol"] = out.apply(
-        lambda row: implied_vol(
-            price=float(row["price"]),
+    option_type = prices_df["option_type"].astype(str).str.lower()
+    unknown = ~option_type.isin(["call", "put"])
+    if unknown.any():
+        raise ValueError("option_type must be 'call' or 'put'.")
+
+    prices = prices_df["price"].to_numpy(dtype=float)
+    strikes = prices_df["strike"].to_numpy(dtype=float)
+    vols = implied_vol_vec(
+        prices=prices,
+        S=S,
+        K=strikes,
+        r=r,
+        q=q,
+        T=T,
+        is_call=(option_type == "call").to_numpy(),
+        method=method,
+    )
+
+    # Re-run failed quotes through the scalar solver to surface its diagnostics.
+    for i in np.flatnonzero(np.isnan(vols)):
+        vols[i] = implied_vol(
+            price=float(prices[i]),
             S=S,
-            K=float(row["strike"]),
+            K=float(strikes[i]),
             r=r,
             q=q,
             T=T,
-            option_type=str(row["option_type"]),
+            option_type=str(option_type.iloc[i]),
             method=method,
-        ),
-        axis=1,
-    )
+        )
+
+    out = prices_df.copy()
+    out["implied_vol"] = vols
     return out
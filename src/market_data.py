@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 
@@ -12,7 +13,8 @@ def _extract_close_prices(data: pd.DataFrame, tickers: list[str]) -> pd.DataFram
         return data
 
     if isinstance(data.columns, pd.MultiIndex):
-        level0 = set(data.columns.get_level_values(0))
+        # levels[0] can keep labels whose columns were dropped, so use the labels in use.
+        level0 = data.columns.get_level_values(0).unique()
         if "Close" in level0:
             close = data["Close"]
         elif "Adj Close" in level0:
@@ -31,12 +33,60 @@ def _extract_close_prices(data: pd.DataFrame, tickers: list[str]) -> pd.DataFram
     if isinstance(close, pd.Series):
         close = close.to_frame(name=tickers[0])
 
-    close = close.copy()
     if len(close.columns) == 1 and len(tickers) == 1:
-        close.columns = [tickers[0]]
+        close = close.rename(columns={close.columns[0]: tickers[0]})
     return close
 
 
+def _gap_days(idx: pd.DatetimeIndex) -> np.ndarray:
+    """Whole calendar days between consecutive index stamps."""
+
+    # asi8 holds UTC ticks in the index's own unit (ns, us, s), tz-aware or not.
+    return np.diff(idx.asi8).view(f"m8[{idx.unit}]") // np.timedelta64(1, "D")
+
+
+_DOWNLOAD_CACHE: dict[tuple[tuple[str, ...], str, str, str], pd.DataFrame] = {}
+_DOWNLOAD_CACHE_SIZE = 128
+
+
+def _download_yfinance(tickers: tuple[str, ...], start: str, end: str, interval: str) -> pd.DataFrame:
+    """Download raw yfinance bars, memoized per request within the session.
+
+    yfinance reports network and rate-limit failures as an empty frame, so
+    empty results are not cached and the next call retries the download.
+    """
+
+    key = (tickers, start, end, interval)
+    cached = _DOWNLOAD_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        import yfinance as yf
+    except ImportError as exc:
+        raise ImportError("Install yfinance to use fetch_prices_yfinance.") from exc
+
+    data = yf.download(
+        tickers=list(tickers),
+        start=start,
+        end=end,
+        interval=interval,
+        auto_adjust=True,
+        progress=False,
+    )
+    if not data.empty:
+        if len(_DOWNLOAD_CACHE) >= _DOWNLOAD_CACHE_SIZE:
+            del _DOWNLOAD_CACHE[next(iter(_DOWNLOAD_CACHE))]
+        _DOWNLOAD_CACHE[key] = data
+    return data
+
+
+def clear_download_cache() -> None:
+    """Forget memoized yfinance downloads so the next fetch hits the network."""
+
+    _DOWNLOAD_CACHE.clear()
+
+
 def fetch_prices_yfinance(
     tickers: list[str],
     start: str,
@@ -53,23 +103,15 @@ def fetch_prices_yfinance(
         Date boundaries in ``YYYY-MM-DD`` format.
     interval:
         Yahoo interval string. Default is daily bars.
-    """
 
-    try:
-        import yfinance as yf
-    except ImportError as exc:
-        raise ImportError("Install yfinance to use fetch_prices_yfinance.") from exc
+    Non-empty responses are cached per ``(tickers, start, end, interval)`` for
+    the session; call :func:`clear_download_cache` to force a refetch.
+    """
 
-    data = yf.download(
-        tickers=tickers,
-        start=start,
-        end=end,
-        interval=interval,
-        auto_adjust=True,
-        progress=False,
-    )
+    data = _download_yfinance(tuple(tickers), start, end, interval)
     prices = _extract_close_prices(data, tickers=tickers)
-    prices.index = pd.to_datetime(prices.index)
+    # set_axis returns a new frame, so the cached download is never mutated.
+    prices = prices.set_axis(pd.to_datetime(prices.index), axis=0)
     return prices.sort_index().dropna(how="all")
 
 
@@ -80,12 +122,11 @@ def price_gap_report(prices: pd.DataFrame, max_gap_days: int = 5) -> pd.DataFram
         return pd.DataFrame(columns=["prev_date", "next_date", "gap_days"])
 
     idx = pd.DatetimeIndex(prices.index).sort_values()
-    diffs = idx.to_series().diff().dropna()
     out = pd.DataFrame(
         {
-            "prev_date": idx[:-1].to_list(),
-            "next_date": idx[1:].to_list(),
-            "gap_days": diffs.dt.days.to_numpy(),
+            "prev_date": idx[:-1],
+            "next_date": idx[1:],
+            "gap_days": _gap_days(idx),
         }
     )
     return out[out["gap_days"] > max_gap_days].reset_index(drop=True)
@@ -97,7 +138,7 @@ def price_data_quality_report(prices: pd.DataFrame, ticker: str) -> pd.DataFrame
     series = prices[ticker].dropna() if ticker in prices.columns else pd.Series(dtype=float)
     first_date = series.index.min() if not series.empty else pd.NaT
     last_date = series.index.max() if not series.empty else pd.NaT
-    max_gap = pd.DatetimeIndex(series.index).to_series().diff().dt.days.max() if len(series) > 1 else pd.NA
+    max_gap = int(_gap_days(pd.DatetimeIndex(series.index)).max()) if len(series) > 1 else pd.NA
 
     return pd.DataFrame(
         [
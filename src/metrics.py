@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 import pandas as pd
 
@@ -10,17 +12,23 @@ def cumulative_returns(returns: np.ndarray) -> np.ndarray:
     """Compute cumulative returns from simple return series."""
 
     arr = np.asarray(returns, dtype=float)
-    return np.cumprod(1.0 + arr) - 1.0
+    # ravel() of the fresh buffer is a view and keeps cumprod's flattening semantics.
+    growth = np.add(arr, 1.0).ravel()
+    np.cumprod(growth, out=growth)
+    growth -= 1.0
+    return growth
 
 
 def max_drawdown(returns: np.ndarray) -> float:
     """Compute maximum drawdown from simple return series."""
 
     arr = np.asarray(returns, dtype=float)
-    wealth = np.cumprod(1.0 + arr)
+    wealth = np.add(arr, 1.0).ravel()
+    np.cumprod(wealth, out=wealth)
     running_peak = np.maximum.accumulate(wealth)
-    drawdowns = wealth / running_peak - 1.0
-    return float(np.min(drawdowns))
+    # Reuse the wealth buffer for wealth / peak; subtracting 1 after the min is exact.
+    np.divide(wealth, running_peak, out=wealth)
+    return float(wealth.min() - 1.0)
 
 
 def annualized_vol(returns: np.ndarray, periods_per_year: int = 252) -> float:
@@ -33,10 +41,28 @@ def annualized_vol(returns: np.ndarray, periods_per_year: int = 252) -> float:
 def cvar(values: np.ndarray, alpha: float = 0.05) -> float:
     """Compute lower-tail conditional value-at-risk at level alpha."""
 
+    if not 0.0 <= alpha <= 1.0:
+        raise ValueError("alpha must be in [0, 1].")
     arr = np.asarray(values, dtype=float)
-    cutoff = np.quantile(arr, alpha)
-    tail = arr[arr <= cutoff]
-    return float(np.mean(tail))
+
+    # Same cutoff as np.quantile(arr, alpha) with linear interpolation, but one
+    # partition both locates it and leaves the guaranteed tail in the prefix, so
+    # only the remainder needs scanning for ties.
+    n = arr.size
+    h = alpha * (n - 1)
+    j = min(int(math.floor(h)), n - 1)
+    k = min(j + 1, n - 1)
+    frac = h - j
+    part = np.partition(arr, [j, k] if k != j else j)
+    lo, hi = part[j], part[k]
+    step = hi - lo
+    cutoff = hi - step * (1.0 - frac) if frac >= 0.5 else lo + step * frac
+
+    rest = part[j + 1 :]
+    if np.isnan(lo) or np.isnan(rest).any():
+        return float("nan")
+    ties = rest[rest <= cutoff]
+    return float((part[: j + 1].sum() + ties.sum()) / (j + 1 + ties.size))
 
 
 def summary_table(returns: np.ndarray, periods_per_year: int = 252) -> pd.DataFrame:
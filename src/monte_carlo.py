@@ -9,21 +9,37 @@ from typing import Any
 import numpy as np
 
 from .processes import simulate_gbm_path_euler
+from .utils import SeedLike, backend_rng, payoff_sign
 
 
-def _payoff(ST: np.ndarray, K: float, option_type: str) -> np.ndarray:
-    if option_type.lower() == "call":
-        return np.maximum(ST - K, 0.0)
-    if option_type.lower() == "put":
-        return np.maximum(K - ST, 0.0)
-    raise ValueError("option_type must be 'call' or 'put'.")
+def _array_module(backend: str) -> Any:
+    """Return the array namespace for ``backend`` (``"numpy"`` or ``"cupy"``)."""
 
+    if backend == "numpy":
+        return np
+    if backend == "cupy":
+        try:
+            import cupy as cp
+        except ImportError as exc:
+            raise ImportError("Install cupy to use backend='cupy'.") from exc
+        return cp
+    raise ValueError("backend must be 'numpy' or 'cupy'.")
+
+
+def _payoff(ST: np.ndarray, K: float, sign: float, xp: Any = np) -> np.ndarray:
+    payoff = ST - K
+    payoff *= sign
+    return xp.maximum(payoff, 0.0, out=payoff)
+
+
+def _ci_bounds(samples: np.ndarray, alpha: float = 0.95) -> tuple[float, float, float, float]:
+    """Return ``(mean, std_error, ci_low, ci_high)`` for ``samples``."""
 
-def _ci_bounds(samples: np.ndarray, alpha: float = 0.95) -> tuple[float, float, float]:
     z = 1.959963984540054  # 95% Gaussian quantile
-    mean = float(np.mean(samples))
-    std_error = float(np.std(samples, ddof=1) / math.sqrt(samples.size))
-    return mean, mean - z * std_error, mean + z * std_error
+    # Array methods keep reductions on-device for CuPy; float() copies back the scalar.
+    mean = float(samples.mean())
+    std_error = float(samples.std(ddof=1)) / math.sqrt(samples.size)
+    return mean, std_error, mean - z * std_error, mean + z * std_error
 
 
 def mc_price_european_gbm_terminal(
@@ -36,36 +52,52 @@ def mc_price_european_gbm_terminal(
     n_paths: int,
     option_type: str,
     antithetic: bool = True,
-    seed: int | None = None,
+    seed: SeedLike = None,
+    backend: str = "numpy",
 ) -> dict[str, Any]:
-    """Price a European option via terminal GBM simulation with confidence intervals."""
+    """Price a European option via terminal GBM simulation with confidence intervals.
+
+    With ``antithetic=True`` each draw ``z`` is paired with ``-z`` and the pair's
+    payoffs are averaged before estimation, so the standard error reflects the
+    pairing; an odd ``n_paths`` is rounded down to whole pairs.
+    ``backend="cupy"`` runs the simulation on a CUDA device; only the scalar
+    estimates are copied back to the host.
+    """
 
     start = time.perf_counter()
-    rng = np.random.default_rng(seed)
+    xp = _array_module(backend)
+    sign = payoff_sign(option_type)
+    # Terminal pricing is bound by Gaussian draws and exp, so simulate with the
+    # fast SFC64 generator in float32 and switch to float64 for the estimators.
+    rng = backend_rng(xp, seed, np.random.SFC64)
+
+    S0_f = np.float32(S0)
+    drift = np.float32((r - q - 0.5 * sigma * sigma) * T)
+    vol = np.float32(sigma * math.sqrt(T))
 
     if antithetic:
         half = n_paths // 2
-        z_half = rng.standard_normal(half)
-        z = np.concatenate([z_half, -z_half])
-        if z.size < n_paths:
-            z = np.concatenate([z, rng.standard_normal(1)])
+        if half == 0:
+            raise ValueError("Antithetic sampling needs n_paths >= 2.")
+        shock = vol * rng.standard_normal(half, dtype=np.float32)
+        payoff = _payoff(S0_f * xp.exp(drift + shock), K, sign, xp).astype(np.float64)
+        payoff += _payoff(S0_f * xp.exp(drift - shock), K, sign, xp)
+        payoff *= 0.5
+        n_simulated = 2 * half
     else:
-        z = rng.standard_normal(n_paths)
-
-    drift = (r - q - 0.5 * sigma * sigma) * T
-    diffusion = sigma * math.sqrt(T) * z
-    ST = S0 * np.exp(drift + diffusion)
+        shock = vol * rng.standard_normal(n_paths, dtype=np.float32)
+        payoff = _payoff(S0_f * xp.exp(drift + shock), K, sign, xp).astype(np.float64)
+        n_simulated = n_paths
 
-    discounted = math.exp(-r * T) * _payoff(ST, K, option_type)
-    price, ci_low, ci_high = _ci_bounds(discounted)
-    std_error = float(np.std(discounted, ddof=1) / math.sqrt(discounted.size))
+    discounted = math.exp(-r * T) * payoff
+    price, std_error, ci_low, ci_high = _ci_bounds(discounted)
 
     return {
         "price": float(price),
         "std_error": std_error,
         "ci_low": float(ci_low),
         "ci_high": float(ci_high),
-        "n_paths": int(discounted.size),
+        "n_paths": int(n_simulated),
         "antithetic": antithetic,
         "runtime_seconds": time.perf_counter() - start,
     }
@@ -81,25 +113,46 @@ def mc_price_european_gbm_path_euler(
     n_paths: int,
     n_steps: int,
     option_type: str,
-    seed: int | None = None,
+    seed: SeedLike = None,
+    backend: str = "numpy",
+    sampler: str = "pseudo",
 ) -> dict[str, Any]:
-    """Price a European option via Euler path simulation and terminal payoff."""
+    """Price a European option via Euler path simulation and terminal payoff.
+
+    ``backend="cupy"`` simulates the Euler factors on a CUDA device and keeps
+    only the terminal spot, since the payoff is path-independent.
+    ``sampler="sobol"`` uses scrambled Sobol points with a Brownian bridge (NumPy
+    backend only); the reported standard error then treats the points as i.i.d.
+    and overstates the quasi-Monte Carlo error.
+    """
 
     start = time.perf_counter()
-    paths = simulate_gbm_path_euler(
-        S0=S0,
-        r=r,
-        q=q,
-        sigma=sigma,
-        T=T,
-        n_paths=n_paths,
-        n_steps=n_steps,
-        seed=seed,
-    )
-    ST = paths[:, -1]
-    discounted = math.exp(-r * T) * _payoff(ST, K, option_type)
-    price, ci_low, ci_high = _ci_bounds(discounted)
-    std_error = float(np.std(discounted, ddof=1) / math.sqrt(discounted.size))
+    xp = _array_module(backend)
+    sign = payoff_sign(option_type)
+    if sampler == "sobol" and xp is not np:
+        raise ValueError("sampler='sobol' requires backend='numpy'.")
+    if xp is np:
+        paths = simulate_gbm_path_euler(
+            S0=S0,
+            r=r,
+            q=q,
+            sigma=sigma,
+            T=T,
+            n_paths=n_paths,
+            n_steps=n_steps,
+            seed=seed,
+            sampler=sampler,
+        )
+        ST = paths[:, -1]
+    else:
+        if sampler != "pseudo":
+            raise ValueError("sampler must be 'pseudo' or 'sobol'.")
+        dt = T / n_steps
+        generator = backend_rng(xp, seed)
+        factors = generator.standard_normal((n_paths, n_steps)) * (sigma * math.sqrt(dt)) + (1.0 + (r - q) * dt)
+        ST = S0 * xp.prod(factors, axis=1)
+    discounted = math.exp(-r * T) * _payoff(ST, K, sign, xp)
+    price, std_error, ci_low, ci_high = _ci_bounds(discounted)
 
     return {
         "price": float(price),
@@ -108,6 +161,7 @@ def mc_price_european_gbm_path_euler(
         "ci_high": float(ci_high),
         "n_paths": int(discounted.size),
         "n_steps": n_steps,
+        "sampler": sampler,
         "runtime_seconds": time.perf_counter() - start,
     }
 
@@ -121,28 +175,31 @@ def mc_control_variate_with_terminal_asset(
     T: float,
     n_paths: int,
     option_type: str,
-    seed: int | None = None,
+    seed: SeedLike = None,
+    backend: str = "numpy",
 ) -> dict[str, Any]:
     """Optional control variate MC using discounted terminal asset as control.
 
     The control variate is X = exp(-rT) S_T with known expectation S0 exp(-qT).
+    ``backend="cupy"`` runs the simulation on a CUDA device.
     """
 
-    rng = np.random.default_rng(seed)
+    xp = _array_module(backend)
+    sign = payoff_sign(option_type)
+    rng = backend_rng(xp, seed)
     z = rng.standard_normal(n_paths)
-    ST = S0 * np.exp((r - q - 0.5 * sigma * sigma) * T + sigma * math.sqrt(T) * z)
+    ST = S0 * xp.exp((r - q - 0.5 * sigma * sigma) * T + sigma * math.sqrt(T) * z)
 
-    Y = math.exp(-r * T) * _payoff(ST, K, option_type)
+    Y = math.exp(-r * T) * _payoff(ST, K, sign, xp)
     X = math.exp(-r * T) * ST
     EX = S0 * math.exp(-q * T)
 
-    cov = float(np.cov(Y, X, ddof=1)[0, 1])
-    var_x = float(np.var(X, ddof=1))
+    cov = float(xp.cov(Y, X, ddof=1)[0, 1])
+    var_x = float(X.var(ddof=1))
     b = cov / var_x if var_x > 0 else 0.0
     Y_cv = Y - b * (X - EX)
 
-    price, ci_low, ci_high = _ci_bounds(Y_cv)
-    std_error = float(np.std(Y_cv, ddof=1) / math.sqrt(Y_cv.size))
+    price, std_error, ci_low, ci_high = _ci_bounds(Y_cv)
 
     return {
         "price": float(price),
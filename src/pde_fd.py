@@ -2,58 +2,59 @@
 
 from __future__ import annotations
 
-import math
 from typing import Any
 
 import numpy as np
 import pandas as pd
+from scipy.linalg import lapack
 
 from .black_scholes import bs_price
 
 
-def _boundary_value(
+def _boundary_values(
     S_max: float,
     K: float,
     r: float,
     q: float,
-    T: float,
-    t: float,
-    option_type: str,
-) -> tuple[float, float]:
-    tau = T - t
-    if option_type.lower() == "call":
-        return 0.0, S_max * math.exp(-q * tau) - K * math.exp(-r * tau)
-    if option_type.lower() == "put":
-        return K * math.exp(-r * tau), 0.0
-    raise ValueError("option_type must be 'call' or 'put'.")
+    tau: np.ndarray,
+    is_call: bool,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Dirichlet values at ``S=0`` and ``S=S_max`` for every time to maturity in ``tau``."""
 
+    if is_call:
+        return np.zeros_like(tau), S_max * np.exp(-q * tau) - K * np.exp(-r * tau)
+    return K * np.exp(-r * tau), np.zeros_like(tau)
 
-def _thomas_solver(lower: np.ndarray, diag: np.ndarray, upper: np.ndarray, rhs: np.ndarray) -> np.ndarray:
-    """Solve tridiagonal system Ax=b via Thomas algorithm."""
 
-    n = diag.size
-    if n == 1:
-        return rhs / diag
+def _tridiag_factor(lower: np.ndarray, diag: np.ndarray, upper: np.ndarray) -> tuple[np.ndarray, ...]:
+    """LU-factor a tridiagonal matrix with LAPACK ``dgttrf`` for repeated solves.
 
-    c_prime = np.zeros(n - 1)
-    d_prime = np.zeros(n)
+    SciPy's ``dgttrf`` wrapper rejects systems smaller than 3x3, so those are
+    padded with identity rows; :func:`_tridiag_solve_factored` pads the RHS to match.
+    """
 
-    c_prime[0] = upper[0] / diag[0]
-    d_prime[0] = rhs[0] / diag[0]
+    n_pad = max(0, 3 - diag.size)
+    if n_pad:
+        lower = np.concatenate([lower, np.zeros(n_pad)])
+        diag = np.concatenate([diag, np.ones(n_pad)])
+        upper = np.concatenate([upper, np.zeros(n_pad)])
+    dl, d, du, du2, ipiv, info = lapack.dgttrf(lower, diag, upper)
+    if info != 0:
+        raise np.linalg.LinAlgError(f"Tridiagonal factorization failed (dgttrf info={info}).")
+    return dl, d, du, du2, ipiv
 
-    for i in range(1, n - 1):
-        denom = diag[i] - lower[i - 1] * c_prime[i - 1]
-        c_prime[i] = upper[i] / denom
-        d_prime[i] = (rhs[i] - lower[i - 1] * d_prime[i - 1]) / denom
 
-    denom_last = diag[-1] - lower[-1] * c_prime[-1]
-    d_prime[-1] = (rhs[-1] - lower[-1] * d_prime[-2]) / denom_last
+def _tridiag_solve_factored(factors: tuple[np.ndarray, ...], rhs: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Solve Ax=b for a matrix factored by :func:`_tridiag_factor`, writing into ``out``."""
 
-    x = np.zeros(n)
-    x[-1] = d_prime[-1]
-    for i in range(n - 2, -1, -1):
-        x[i] = d_prime[i] - c_prime[i] * x[i + 1]
-    return x
+    n_pad = factors[1].size - rhs.size
+    if n_pad:
+        rhs = np.concatenate([rhs, np.zeros(n_pad)])
+    x, info = lapack.dgttrs(*factors, rhs)
+    if info != 0:
+        raise np.linalg.LinAlgError(f"Tridiagonal solve failed (dgttrs info={info}).")
+    out[:] = x[: out.size]
+    return out
 
 
 def fd_price_european_bs(
@@ -88,15 +89,17 @@ def fd_price_european_bs(
     S_grid = np.linspace(0.0, S_max, M + 1)
     t_grid = np.linspace(0.0, T, N + 1)
 
-    if option_type.lower() == "call":
+    kind = option_type.lower()
+    if kind == "call":
         V = np.maximum(S_grid - K, 0.0)
-    elif option_type.lower() == "put":
+    elif kind == "put":
         V = np.maximum(K - S_grid, 0.0)
     else:
         raise ValueError("option_type must be 'call' or 'put'.")
 
-    value_grid = np.zeros((N + 1, M + 1))
+    value_grid = np.empty((N + 1, M + 1))
     value_grid[N, :] = V
+    left_bc, right_bc = _boundary_values(S_max, K, r, q, T - t_grid, kind == "call")
 
     i = np.arange(1, M)
     alpha = 0.5 * sigma * sigma * i * i
@@ -106,47 +109,43 @@ def fd_price_european_bs(
     if scheme_u not in {"CN", "IMPLICIT"}:
         raise ValueError("scheme must be either 'CN' or 'implicit'.")
 
-    for n in range(N - 1, -1, -1):
-        t_now = t_grid[n]
-        t_next = t_grid[n + 1]
-        left_now, right_now = _boundary_value(S_max, K, r, q, T, t_now, option_type)
-        left_next, right_next = _boundary_value(S_max, K, r, q, T, t_next, option_type)
+    # Neither side of the scheme depends on time: build coefficients and factor
+    # the LHS matrix once, then reuse them for every step.
+    theta = 1.0 if scheme_u == "IMPLICIT" else 0.5
+    lower = -theta * dt * (alpha - beta)
+    diag = 1.0 + theta * dt * (2.0 * alpha + r)
+    upper = -theta * dt * (alpha + beta)
+    factors = _tridiag_factor(lower[1:], diag, upper[:-1])
+
+    # Explicit stencil bands as contiguous rows (upper, diag, lower), applied to
+    # the whole known layer so its boundary nodes feed the end rows directly.
+    explicit_weight = 1.0 - theta
+    rhs_coefs = np.empty((3, M - 1))
+    np.multiply(alpha + beta, explicit_weight * dt, out=rhs_coefs[0])
+    np.multiply(2.0 * alpha + r, -explicit_weight * dt, out=rhs_coefs[1])
+    rhs_coefs[1] += 1.0
+    np.multiply(alpha - beta, explicit_weight * dt, out=rhs_coefs[2])
+
+    rhs = np.empty(M - 1)
+    tmp = np.empty(M - 1)
 
+    for n in range(N - 1, -1, -1):
+        V = value_grid[n + 1]
         if scheme_u == "IMPLICIT":
-            lower = -dt * (alpha - beta)
-            diag = 1.0 + dt * (2.0 * alpha + r)
-            upper = -dt * (alpha + beta)
-
-            rhs = V[1:M].copy()
-            rhs[0] -= lower[0] * left_now
-            rhs[-1] -= upper[-1] * right_now
-
-        else:  # Crank-Nicolson
-            lower_lhs = -0.5 * dt * (alpha - beta)
-            diag_lhs = 1.0 + 0.5 * dt * (2.0 * alpha + r)
-            upper_lhs = -0.5 * dt * (alpha + beta)
-
-            lower_rhs = 0.5 * dt * (alpha - beta)
-            diag_rhs = 1.0 - 0.5 * dt * (2.0 * alpha + r)
-            upper_rhs = 0.5 * dt * (alpha + beta)
-
-            rhs = (
-                diag_rhs * V[1:M]
-                + lower_rhs * np.concatenate(([left_next], V[1 : M - 1]))
-                + upper_rhs * np.concatenate((V[2:M], [right_next]))
-            )
-            rhs[0] -= lower_lhs[0] * left_now
-            rhs[-1] -= upper_lhs[-1] * right_now
-
-            lower, diag, upper = lower_lhs, diag_lhs, upper_lhs
-
-        V_new = np.zeros_like(V)
-        V_new[0] = left_now
-        V_new[M] = right_now
-        V_new[1:M] = _thomas_solver(lower[1:], diag, upper[:-1], rhs)
-
-        V = V_new
-        value_grid[n, :] = V
+            rhs[:] = V[1:M]
+        else:
+            np.multiply(rhs_coefs[1], V[1:M], out=rhs)
+            np.multiply(rhs_coefs[2], V[: M - 1], out=tmp)
+            rhs += tmp
+            np.multiply(rhs_coefs[0], V[2:], out=tmp)
+            rhs += tmp
+        rhs[0] -= lower[0] * left_bc[n]
+        rhs[-1] -= upper[-1] * right_bc[n]
+
+        V_new = value_grid[n]
+        V_new[0] = left_bc[n]
+        V_new[M] = right_bc[n]
+        _tridiag_solve_factored(factors, rhs, V_new[1:M])
 
     price = float(np.interp(S0, S_grid, value_grid[0, :]))
     return {
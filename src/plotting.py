@@ -1,10 +1,15 @@
-"""Matplotlib plotting helpers for experiments."""
+"""Matplotlib plotting helpers for experiments.
+
+matplotlib is imported inside each ``plot_*`` function so that importing this
+module (and anything that pulls it in) does not pay matplotlib start-up cost.
+"""
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
@@ -15,9 +20,25 @@ def _prepare_path(path: str | Path) -> Path:
     return out
 
 
+def _iter_sorted_groups(df: pd.DataFrame, by: str, order_by: str) -> Iterator[tuple[Any, pd.DataFrame]]:
+    """Yield ``(key, rows)`` per distinct ``by`` value with rows ordered by ``order_by``.
+
+    One factorize plus one lexsort replaces a groupby and a sort per group;
+    missing keys are skipped as in ``groupby``.
+    """
+
+    codes, uniques = pd.factorize(df[by], sort=True)
+    order = np.lexsort((df[order_by].to_numpy(), codes))
+    bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    for k, key in enumerate(uniques):
+        yield key, df.iloc[order[bounds[k] : bounds[k + 1]]]
+
+
 def plot_binomial_convergence(df: pd.DataFrame, path: str | Path) -> None:
     """Plot CRR convergence to Black-Scholes price."""
 
+    import matplotlib.pyplot as plt
+
     save_path = _prepare_path(path)
     fig, ax = plt.subplots(figsize=(8, 4.5))
     ax.plot(df["N"], df["binomial_price"], marker="o", label="Binomial")
@@ -35,6 +56,8 @@ def plot_binomial_convergence(df: pd.DataFrame, path: str | Path) -> None:
 def plot_implied_vol_recovery(df: pd.DataFrame, path: str | Path) -> None:
     """Plot recovered implied vol versus strike."""
 
+    import matplotlib.pyplot as plt
+
     save_path = _prepare_path(path)
     fig, ax = plt.subplots(figsize=(8, 4.5))
     ax.plot(df["strike"], df["implied_vol"], marker="o", label="Recovered IV")
@@ -53,6 +76,8 @@ def plot_implied_vol_recovery(df: pd.DataFrame, path: str | Path) -> None:
 def plot_mc_ci(df: pd.DataFrame, bs_price: float, path: str | Path) -> None:
     """Plot Monte Carlo estimates with confidence intervals versus BS benchmark."""
 
+    import matplotlib.pyplot as plt
+
     save_path = _prepare_path(path)
     fig, ax = plt.subplots(figsize=(8, 4.5))
     x = np.arange(len(df))
@@ -75,6 +100,8 @@ def plot_mc_ci(df: pd.DataFrame, bs_price: float, path: str | Path) -> None:
 def plot_pde_error(df: pd.DataFrame, path: str | Path) -> None:
     """Plot finite-difference absolute error versus grid density."""
 
+    import matplotlib.pyplot as plt
+
     save_path = _prepare_path(path)
     fig, ax = plt.subplots(figsize=(8, 4.5))
     grid_size = (df["M"] * df["N"]).to_numpy()
@@ -93,6 +120,8 @@ def plot_pde_error(df: pd.DataFrame, path: str | Path) -> None:
 def plot_hedging_error_hist(errors: np.ndarray, path: str | Path) -> None:
     """Plot histogram of hedging error distribution."""
 
+    import matplotlib.pyplot as plt
+
     save_path = _prepare_path(path)
     fig, ax = plt.subplots(figsize=(8, 4.5))
     ax.hist(errors, bins=50, alpha=0.8, edgecolor="white")
@@ -108,12 +137,13 @@ def plot_hedging_error_hist(errors: np.ndarray, path: str | Path) -> None:
 def plot_hedging_tradeoff(df: pd.DataFrame, path: str | Path) -> None:
     """Plot hedging error standard deviation by rebalance interval."""
 
+    import matplotlib.pyplot as plt
+
     save_path = _prepare_path(path)
     fig, ax = plt.subplots(figsize=(8, 4.5))
 
     if "tx_cost_per_dollar" in df.columns:
-        for tx, sub in df.groupby("tx_cost_per_dollar"):
-            sub_sorted = sub.sort_values("rebalance_every_k_steps")
+        for tx, sub_sorted in _iter_sorted_groups(df, "tx_cost_per_dollar", "rebalance_every_k_steps"):
             ax.plot(
                 sub_sorted["rebalance_every_k_steps"],
                 sub_sorted["std_error"],
@@ -137,10 +167,11 @@ def plot_hedging_tradeoff(df: pd.DataFrame, path: str | Path) -> None:
 def plot_smile(df: pd.DataFrame, path: str | Path) -> None:
     """Plot implied-vol smile from stochastic-vol prices."""
 
+    import matplotlib.pyplot as plt
+
     save_path = _prepare_path(path)
     fig, ax = plt.subplots(figsize=(8, 4.5))
-    for maturity, sub in df.groupby("maturity"):
-        sub = sub.sort_values("strike")
+    for maturity, sub in _iter_sorted_groups(df, "maturity", "strike"):
         ax.plot(sub["strike"], sub["implied_vol"], marker="o", label=f"T={maturity}")
     ax.set_xlabel("Strike")
     ax.set_ylabel("Implied volatility")
@@ -159,6 +190,8 @@ def plot_overlay_distribution(
 ) -> None:
     """Plot return distributions for unhedged and protected portfolio."""
 
+    import matplotlib.pyplot as plt
+
     save_path = _prepare_path(path)
     fig, ax = plt.subplots(figsize=(8, 4.5))
     ax.hist(unhedged_returns, bins=60, alpha=0.5, label="Unhedged", density=True)
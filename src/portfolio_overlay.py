@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+from itertools import product
 from typing import Any
 
 import numpy as np
@@ -13,6 +14,61 @@ from .metrics import summary_table
 from .processes import simulate_gbm_path_exact
 
 
+def _evaluate_overlay(
+    paths: np.ndarray,
+    S0: float,
+    r: float,
+    q: float,
+    sigma: float,
+    T_sim: float,
+    K_put: float,
+    T_put: float,
+    notional: float,
+    premium_budget_fraction: float,
+) -> dict[str, Any]:
+    """Evaluate the unhedged and protective-put legs on pre-simulated ``paths``."""
+
+    if T_put > T_sim:
+        raise ValueError("T_put must be <= T_sim in this implementation.")
+
+    n_steps = paths.shape[1] - 1
+    units_underlying = notional / S0
+    put_premium = bs_put_price(S0, K_put, r, q, sigma, T_put)
+    budget = premium_budget_fraction * notional
+    hedge_units = min(units_underlying, budget / put_premium if put_premium > 0 else 0.0)
+
+    idx_put = int(round((T_put / T_sim) * n_steps))
+    idx_put = max(1, min(idx_put, n_steps))
+
+    S_put = paths[:, idx_put]
+    S_T = paths[:, -1]
+
+    premium_paid = hedge_units * put_premium
+
+    # Two buffers carry the whole computation: terminal wealth for each leg is
+    # built in place and then converted to returns in place.
+    unhedged_returns = np.multiply(S_T, units_underlying)
+    hedged_returns = np.subtract(K_put, S_put)
+    np.maximum(hedged_returns, 0.0, out=hedged_returns)
+    # Put payoff is received at T_put; grow to T_sim for consistent horizon comparison.
+    hedged_returns *= hedge_units * math.exp(r * (T_sim - T_put))
+    hedged_returns += unhedged_returns
+    hedged_returns -= premium_paid
+
+    for wealth in (unhedged_returns, hedged_returns):
+        wealth /= notional
+        wealth -= 1.0
+
+    return {
+        "unhedged_returns": unhedged_returns,
+        "hedged_returns": hedged_returns,
+        "hedge_units": hedge_units,
+        "premium_paid": premium_paid,
+        "premium_budget": budget,
+        "coverage_ratio": hedge_units / units_underlying if units_underlying > 0 else 0.0,
+    }
+
+
 def protective_put_overlay_simulation(
     S0: float,
     r: float,
@@ -46,38 +102,61 @@ def protective_put_overlay_simulation(
         n_steps=n_steps,
         seed=seed,
     )
+    return _evaluate_overlay(paths, S0, r, q, sigma, T_sim, K_put, T_put, notional, premium_budget_fraction)
 
-    units_underlying = notional / S0
-    put_premium = bs_put_price(S0, K_put, r, q, sigma, T_put)
-    budget = premium_budget_fraction * notional
-    hedge_units = min(units_underlying, budget / put_premium if put_premium > 0 else 0.0)
-
-    idx_put = int(round((T_put / T_sim) * n_steps))
-    idx_put = max(1, min(idx_put, n_steps))
 
-    S_put = paths[:, idx_put]
-    S_T = paths[:, -1]
-
-    unhedged_terminal = units_underlying * S_T
-    put_payoff = hedge_units * np.maximum(K_put - S_put, 0.0)
+def protective_put_overlay_grid(
+    S0: float,
+    r: float,
+    q: float,
+    sigma: float,
+    T_sim: float,
+    notional: float,
+    n_paths: int,
+    n_steps: int,
+    K_put_list: list[float],
+    T_put_list: list[float],
+    premium_budget_fraction_list: list[float],
+    seed: int | None = 42,
+) -> pd.DataFrame:
+    """Sweep overlay settings over one shared set of simulated paths.
 
-    # Put payoff is received at T_put; grow to T_sim for consistent horizon comparison.
-    put_payoff_grown = put_payoff * math.exp(r * (T_sim - T_put))
+    Paths do not depend on the put contract or the budget, so they are simulated
+    once and every grid point only re-evaluates the overlay.
+    """
 
-    premium_paid = hedge_units * put_premium
-    hedged_terminal = unhedged_terminal - premium_paid + put_payoff_grown
+    if not (K_put_list and T_put_list and premium_budget_fraction_list):
+        raise ValueError("K_put_list, T_put_list and premium_budget_fraction_list must be non-empty.")
+    if max(T_put_list) > T_sim:
+        raise ValueError("T_put must be <= T_sim in this implementation.")
 
-    unhedged_returns = unhedged_terminal / notional - 1.0
-    hedged_returns = hedged_terminal / notional - 1.0
+    paths = simulate_gbm_path_exact(
+        S0=S0,
+        r=r,
+        q=q,
+        sigma=sigma,
+        T=T_sim,
+        n_paths=n_paths,
+        n_steps=n_steps,
+        seed=seed,
+    )
 
-    return {
-        "unhedged_returns": unhedged_returns,
-        "hedged_returns": hedged_returns,
-        "hedge_units": hedge_units,
-        "premium_paid": premium_paid,
-        "premium_budget": budget,
-        "coverage_ratio": hedge_units / units_underlying if units_underlying > 0 else 0.0,
-    }
+    rows = []
+    for K_put, T_put, budget_fraction in product(K_put_list, T_put_list, premium_budget_fraction_list):
+        out = _evaluate_overlay(paths, S0, r, q, sigma, T_sim, K_put, T_put, notional, budget_fraction)
+        stats = summary_table(out["hedged_returns"]).iloc[0].to_dict()
+        rows.append(
+            {
+                "K_put": K_put,
+                "T_put": T_put,
+                "premium_budget_fraction": budget_fraction,
+                "hedge_units": out["hedge_units"],
+                "premium_paid": out["premium_paid"],
+                "coverage_ratio": out["coverage_ratio"],
+                **stats,
+            }
+        )
+    return pd.DataFrame(rows)
 
 
 def overlay_risk_metrics(unhedged_returns: np.ndarray, hedged_returns: np.ndarray) -> pd.DataFrame:
@@ -5,13 +5,17 @@ from __future__ import annotations
 import math
 
 import numpy as np
+from scipy.special import ndtri
+from scipy.stats import qmc
+
+from .utils import SeedLike, make_rng
 
 
 def brownian_increments(
     n_paths: int,
     n_steps: int,
     dt: float,
-    seed: int | None = None,
+    seed: SeedLike = None,
 ) -> np.ndarray:
     """Generate Brownian increments of shape (n_paths, n_steps)."""
 
@@ -20,10 +24,99 @@ def brownian_increments(
     if dt <= 0:
         raise ValueError("dt must be positive.")
 
-    rng = np.random.default_rng(seed)
+    rng = make_rng(seed)
     return rng.standard_normal((n_paths, n_steps)) * math.sqrt(dt)
 
 
+def _given_shocks(z: np.ndarray, n_paths: int, n_steps: int) -> np.ndarray:
+    """Validate caller-supplied standard normal shocks of shape (n_paths, n_steps)."""
+
+    z = np.asarray(z, dtype=float)
+    if z.shape != (n_paths, n_steps):
+        raise ValueError(f"z must have shape ({n_paths}, {n_steps}); got {z.shape}.")
+    return z
+
+
+def _brownian_bridge_plan(
+    n_steps: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return the construction order of a Brownian bridge on a unit-step grid.
+
+    Entry ``i`` fills point ``bridge[i]`` from its nearest already-built
+    neighbours ``left[i] - 1`` and ``right[i]`` (``left[i] == 0`` means the
+    origin), so the first Gaussian sets the terminal value and later ones
+    refine ever shorter intervals.
+    """
+
+    built = np.zeros(n_steps, dtype=bool)
+    bridge = np.zeros(n_steps, dtype=np.intp)
+    left = np.zeros(n_steps, dtype=np.intp)
+    right = np.zeros(n_steps, dtype=np.intp)
+    left_weight = np.zeros(n_steps)
+    right_weight = np.zeros(n_steps)
+    std = np.zeros(n_steps)
+
+    built[-1] = True
+    bridge[0] = n_steps - 1
+    std[0] = math.sqrt(n_steps)
+    j = 0
+    for i in range(1, n_steps):
+        while built[j]:
+            j += 1
+        k = j
+        while not built[k]:
+            k += 1
+        point = j + (k - 1 - j) // 2
+        built[point] = True
+        bridge[i], left[i], right[i] = point, j, k
+        width = k + 1 - j
+        left_weight[i] = (k - point) / width
+        right_weight[i] = (point + 1 - j) / width
+        std[i] = math.sqrt((point + 1 - j) * (k - point) / width)
+        j = k + 1
+        if j >= n_steps:
+            j = 0
+    return bridge, left, right, left_weight, right_weight, std
+
+
+def sobol_brownian_increments(
+    n_paths: int,
+    n_steps: int,
+    dt: float,
+    seed: SeedLike = None,
+) -> np.ndarray:
+    """Generate quasi-random Brownian increments of shape (n_paths, n_steps).
+
+    Each path is one point of a scrambled Sobol sequence in ``n_steps``
+    dimensions, mapped to Gaussians and assembled with a Brownian bridge so the
+    leading (best distributed) dimensions drive the coarse path shape.
+    Sobol balance properties hold for power-of-two ``n_paths``.
+    """
+
+    if n_paths <= 0 or n_steps <= 0:
+        raise ValueError("n_paths and n_steps must be positive.")
+    if dt <= 0:
+        raise ValueError("dt must be positive.")
+
+    # Integer seeds go to SciPy unchanged; None and Generators follow make_rng.
+    sobol_seed = seed if isinstance(seed, int) else make_rng(seed)
+    z = ndtri(qmc.Sobol(d=n_steps, scramble=True, seed=sobol_seed).random(n_paths))
+    bridge, left, right, left_weight, right_weight, std = _brownian_bridge_plan(n_steps)
+
+    W = np.empty((n_paths, n_steps), dtype=float)
+    np.multiply(z[:, 0], std[0], out=W[:, -1])
+    for i in range(1, n_steps):
+        point = W[:, bridge[i]]
+        np.multiply(W[:, right[i]], right_weight[i], out=point)
+        if left[i]:
+            point += left_weight[i] * W[:, left[i] - 1]
+        point += std[i] * z[:, i]
+
+    W[:, 1:] -= W[:, :-1].copy()
+    W *= math.sqrt(dt)
+    return W
+
+
 def simulate_gbm_exact(
     S0: float,
     r: float,
@@ -31,14 +124,14 @@ def simulate_gbm_exact(
     sigma: float,
     T: float,
     n_paths: int,
-    seed: int | None = None,
+    seed: SeedLike = None,
 ) -> np.ndarray:
     """Simulate terminal values S_T from exact GBM distribution."""
 
     if T <= 0:
         raise ValueError("T must be positive.")
 
-    rng = np.random.default_rng(seed)
+    rng = make_rng(seed)
     z = rng.standard_normal(n_paths)
     drift = (r - q - 0.5 * sigma * sigma) * T
     diffusion = sigma * math.sqrt(T) * z
@@ -53,16 +146,23 @@ def simulate_gbm_path_exact(
     T: float,
     n_paths: int,
     n_steps: int,
-    seed: int | None = None,
+    seed: SeedLike = None,
+    z: np.ndarray | None = None,
 ) -> np.ndarray:
-    """Simulate full GBM paths with exact per-step lognormal discretization."""
+    """Simulate full GBM paths with exact per-step lognormal discretization.
+
+    Pass standard normal shocks ``z`` of shape (n_paths, n_steps) to drive the
+    paths with common random numbers; ``seed`` is then ignored.
+    """
 
     if n_steps <= 0:
         raise ValueError("n_steps must be positive.")
 
     dt = T / n_steps
-    rng = np.random.default_rng(seed)
-    z = rng.standard_normal((n_paths, n_steps))
+    if z is None:
+        z = make_rng(seed).standard_normal((n_paths, n_steps))
+    else:
+        z = _given_shocks(z, n_paths, n_steps)
     log_inc = (r - q - 0.5 * sigma * sigma) * dt + sigma * math.sqrt(dt) * z
 
     paths = np.empty((n_paths, n_steps + 1), dtype=float)
@@ -79,10 +179,16 @@ def simulate_gbm_path_euler(
     T: float,
     n_paths: int,
     n_steps: int,
-    seed: int | None = None,
+    seed: SeedLike = None,
+    sampler: str = "pseudo",
+    z: np.ndarray | None = None,
 ) -> np.ndarray:
     """Simulate GBM paths using Euler discretization.
 
+    ``sampler="sobol"`` drives the paths with :func:`sobol_brownian_increments`
+    instead of pseudo-random increments. Passing standard normal shocks ``z`` of
+    shape (n_paths, n_steps) overrides both ``seed`` and ``sampler``.
+
     Note
     ----
     GBM admits an exact discretization; Euler is included for numerical-method demonstrations.
@@ -92,11 +198,22 @@ def simulate_gbm_path_euler(
         raise ValueError("n_steps must be positive.")
 
     dt = T / n_steps
-    dW = brownian_increments(n_paths=n_paths, n_steps=n_steps, dt=dt, seed=seed)
-
+    if z is not None:
+        dW = _given_shocks(z, n_paths, n_steps) * math.sqrt(dt)
+    elif sampler == "pseudo":
+        dW = brownian_increments(n_paths=n_paths, n_steps=n_steps, dt=dt, seed=seed)
+    elif sampler == "sobol":
+        dW = sobol_brownian_increments(n_paths=n_paths, n_steps=n_steps, dt=dt, seed=seed)
+    else:
+        raise ValueError("sampler must be 'pseudo' or 'sobol'.")
+
+    # Each Euler step multiplies S_t by (1 + (r - q) dt + sigma dW), so the whole
+    # path is a running product of per-step factors.
     paths = np.empty((n_paths, n_steps + 1), dtype=float)
     paths[:, 0] = S0
-    for t in range(n_steps):
-        S_t = paths[:, t]
-        paths[:, t + 1] = S_t + (r - q) * S_t * dt + sigma * S_t * dW[:, t]
+    factors = paths[:, 1:]
+    np.multiply(dW, sigma, out=factors)
+    factors += 1.0 + (r - q) * dt
+    np.cumprod(factors, axis=1, out=factors)
+    factors *= S0
     return paths
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 import pandas as pd
 
 from .processes import simulate_gbm_path_euler, simulate_gbm_path_exact
+from .utils import SeedLike, make_rng
 
 
 def euler_scheme_gbm_step(S: float, r: float, q: float, sigma: float, dt: float, dW: float) -> float:
@@ -22,16 +25,41 @@ def error_vs_step_count_experiment(
     T: float,
     n_paths: int,
     step_counts: list[int],
-    seed: int | None = 42,
+    seed: SeedLike = 42,
 ) -> pd.DataFrame:
-    """Compare Euler and exact GBM terminal moment errors over step counts."""
+    """Compare Euler and exact GBM terminal moment errors over step counts.
+
+    Both schemes are driven by the same antithetic shock block at each step
+    count (common random numbers), so their difference isolates discretization
+    error rather than independent sampling noise.
+
+    As in multilevel Monte Carlo, one Brownian path is drawn on the finest grid
+    and every step count dividing it reuses that path: its shocks are the
+    normalized sums of the fine shocks over each coarse step. Other step counts
+    get their own antithetic block.
+    """
 
     rows: list[dict[str, float]] = []
     theoretical_mean = S0 * float(np.exp((r - q) * T))
+    rng = make_rng(seed)
+    half = (n_paths + 1) // 2
+
+    def _antithetic_block(n_steps: int) -> np.ndarray:
+        z = rng.standard_normal((half, n_steps))
+        return np.concatenate([z, -z])[:n_paths]
+
+    finest = max(step_counts, default=0)
+    z_fine = _antithetic_block(finest) if finest > 0 else None
 
     for n_steps in step_counts:
-        euler_paths = simulate_gbm_path_euler(S0, r, q, sigma, T, n_paths, n_steps, seed=seed)
-        exact_paths = simulate_gbm_path_exact(S0, r, q, sigma, T, n_paths, n_steps, seed=seed)
+        if z_fine is not None and n_steps > 0 and finest % n_steps == 0:
+            ratio = finest // n_steps
+            z = z_fine.reshape(n_paths, n_steps, ratio).sum(axis=2)
+            z /= math.sqrt(ratio)
+        else:
+            z = _antithetic_block(n_steps)
+        euler_paths = simulate_gbm_path_euler(S0, r, q, sigma, T, n_paths, n_steps, z=z)
+        exact_paths = simulate_gbm_path_exact(S0, r, q, sigma, T, n_paths, n_steps, z=z)
 
         euler_mean = float(euler_paths[:, -1].mean())
         exact_mean = float(exact_paths[:, -1].mean())
@@ -3,12 +3,94 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Callable, Iterator
+from functools import lru_cache, partial
 from typing import Any
 
 import numpy as np
 import pandas as pd
+from numpy.typing import DTypeLike
 
-from .implied_vol import implied_vol
+from .implied_vol import implied_vol_vec
+from .utils import SeedLike, backend_rng, make_rng, payoff_sign
+
+
+_TIME_BLOCK = 16  # Time steps of Gaussian draws generated per block.
+
+
+def _heston_lite_step(
+    S_prev: np.ndarray,
+    S_next: np.ndarray,
+    V: np.ndarray,
+    dW1: np.ndarray,
+    xi_dW2: np.ndarray,
+    drift_dt: float,
+    kappa_theta_dt: float,
+    kappa_dt: float,
+    dt: float,
+    work: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+) -> None:
+    """Advance spot and variance one full-truncation step in place.
+
+    ``drift_dt = (r - q) dt``, ``kappa_theta_dt = kappa theta dt`` and
+    ``kappa_dt = kappa dt`` are hoisted by the caller, and the variance shock
+    arrives pre-scaled as ``xi * dW2``. ``S_next`` may alias ``S_prev``;
+    ``work`` holds four scratch vectors.
+    """
+
+    v_pos, sqrt_v, step, shock = work
+    np.maximum(V, 0.0, out=v_pos)
+    np.sqrt(v_pos, out=sqrt_v)
+
+    np.multiply(v_pos, -0.5 * dt, out=step)
+    step += drift_dt
+    np.multiply(sqrt_v, dW1, out=shock)
+    step += shock
+    np.exp(step, out=step)
+    np.multiply(S_prev, step, out=S_next)
+
+    np.multiply(v_pos, -kappa_dt, out=step)
+    step += kappa_theta_dt
+    V += step
+    np.multiply(sqrt_v, xi_dW2, out=shock)
+    V += shock
+    np.maximum(V, 0.0, out=V)
+
+
+def _heston_lite_increments(
+    rng: np.random.Generator,
+    n_paths: int,
+    n_steps: int,
+    dt: float,
+    xi: float,
+    rho: float,
+    dtype: DTypeLike,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Yield ``(dW1, xi * dW2)`` for each time step, with ``corr(dW1, dW2) = rho``.
+
+    Gaussians are drawn ``_TIME_BLOCK`` steps at a time into one reused buffer,
+    so RNG scratch is O(n_paths) rather than O(n_paths * n_steps); the yielded
+    rows are overwritten by the next block. xi and sqrt(dt) are folded into the
+    variance shock here instead of at every step.
+    """
+
+    sqrt_dt = math.sqrt(dt)
+    rho_bar = math.sqrt(max(1.0 - rho * rho, 0.0))
+    n_rows = min(_TIME_BLOCK, n_steps)
+    block = np.empty((n_rows, 2, n_paths), dtype=dtype)
+    scratch = np.empty((n_rows, n_paths), dtype=dtype)
+
+    for t0 in range(0, n_steps, _TIME_BLOCK):
+        n_block = min(_TIME_BLOCK, n_steps - t0)
+        z = block[:n_block]
+        rng.standard_normal(out=z, dtype=dtype)
+        dW1, xi_dW2 = z[:, 0], z[:, 1]
+        dW1 *= sqrt_dt
+        xi_dW2 *= xi * sqrt_dt * rho_bar
+        np.multiply(dW1, xi * rho, out=scratch[:n_block])
+        xi_dW2 += scratch[:n_block]
+        for t in range(n_block):
+            yield dW1[t], xi_dW2[t]
 
 
 def simulate_heston_lite_paths(
@@ -23,34 +105,177 @@ def simulate_heston_lite_paths(
     T: float,
     n_paths: int,
     n_steps: int,
-    seed: int | None = None,
+    seed: SeedLike = None,
+    dtype: DTypeLike = np.float64,
 ) -> np.ndarray:
-    """Simulate Heston-lite paths using full truncation for variance."""
+    """Simulate Heston-lite paths using full truncation for variance.
+
+    ``dtype=np.float32`` halves memory traffic; pricing noise from MC dominates
+    the float32 rounding for typical path counts.
+    """
 
     if not (-1.0 <= rho <= 1.0):
         raise ValueError("rho must be in [-1, 1].")
 
     dt = T / n_steps
-    rng = np.random.default_rng(seed)
+    rng = make_rng(seed)
+
+    # The loop walks time, so spots are stored time-major: every step then reads
+    # and writes contiguous rows.
+    S = np.empty((n_steps + 1, n_paths), dtype=dtype)
+    S[0] = S0
+    # Only the current variance is needed, so V is a single state vector.
+    V = np.full(n_paths, V0, dtype=dtype)
+    work = tuple(np.empty(n_paths, dtype=dtype) for _ in range(4))
+
+    drift_dt, kappa_theta_dt, kappa_dt = (r - q) * dt, kappa * theta * dt, kappa * dt
+    increments = _heston_lite_increments(rng, n_paths, n_steps, dt, xi, rho, dtype)
+    for t, (dW1, xi_dW2) in enumerate(increments):
+        _heston_lite_step(S[t], S[t + 1], V, dW1, xi_dW2, drift_dt, kappa_theta_dt, kappa_dt, dt, work)
+
+    # Callers get the usual C-contiguous (n_paths, n_steps + 1) layout.
+    return np.ascontiguousarray(S.T)
+
+
+def _heston_lite_advance(
+    S: np.ndarray,
+    V: np.ndarray,
+    rng: np.random.Generator,
+    r: float,
+    q: float,
+    kappa: float,
+    theta: float,
+    xi: float,
+    rho: float,
+    tau: float,
+    n_steps: int,
+    work: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+) -> None:
+    """Evolve the spot/variance state ``(S, V)`` in place over ``tau`` years."""
+
+    dt = tau / n_steps
+    drift_dt, kappa_theta_dt, kappa_dt = (r - q) * dt, kappa * theta * dt, kappa * dt
+    for dW1, xi_dW2 in _heston_lite_increments(rng, S.size, n_steps, dt, xi, rho, S.dtype):
+        _heston_lite_step(S, S, V, dW1, xi_dW2, drift_dt, kappa_theta_dt, kappa_dt, dt, work)
+
+
+@lru_cache(maxsize=None)
+def _heston_lite_step_kernel() -> Any:
+    """Build (once) the fused CuPy kernel for one full-truncation step."""
+
+    try:
+        import cupy as cp
+    except ImportError as exc:
+        raise ImportError("Install cupy to use backend='cupy'.") from exc
+
+    return cp.ElementwiseKernel(
+        "T dw1, T xi_dw2, T drift_dt, T kappa_theta_dt, T kappa_dt, T half_dt",
+        "T s, T v",
+        """
+        T v_pos = v > 0 ? v : 0;
+        T sqrt_v = sqrt(v_pos);
+        s = s * exp(drift_dt - half_dt * v_pos + sqrt_v * dw1);
+        v = v + kappa_theta_dt - kappa_dt * v_pos + sqrt_v * xi_dw2;
+        v = v > 0 ? v : 0;
+        """,
+        "heston_lite_step",
+    )
+
+
+def _heston_lite_advance_cupy(
+    S: Any,
+    V: Any,
+    rng: Any,
+    r: float,
+    q: float,
+    kappa: float,
+    theta: float,
+    xi: float,
+    rho: float,
+    tau: float,
+    n_steps: int,
+) -> None:
+    """Device counterpart of :func:`_heston_lite_advance` for CuPy arrays.
 
-    z1 = rng.standard_normal((n_paths, n_steps))
-    z2 = rng.standard_normal((n_paths, n_steps))
+    Each time step is one fused elementwise kernel over all paths, so per-path
+    state stays in registers; Gaussians are drawn on the device in blocks.
+    """
 
-    dW1 = math.sqrt(dt) * z1
-    dW2 = math.sqrt(dt) * (rho * z1 + math.sqrt(max(1.0 - rho * rho, 0.0)) * z2)
+    heston_step = _heston_lite_step_kernel()
+    dt = tau / n_steps
+    sqrt_dt = math.sqrt(dt)
+    rho_bar = math.sqrt(max(1.0 - rho * rho, 0.0))
+    scalar = S.dtype.type
+    coefs = (scalar((r - q) * dt), scalar(kappa * theta * dt), scalar(kappa * dt), scalar(0.5 * dt))
+
+    for t0 in range(0, n_steps, _TIME_BLOCK):
+        n_block = min(_TIME_BLOCK, n_steps - t0)
+        dW1, xi_dW2 = rng.standard_normal((2, n_block, S.size), dtype=S.dtype)
+        dW1 *= sqrt_dt
+        xi_dW2 *= xi * sqrt_dt * rho_bar
+        xi_dW2 += (xi * rho) * dW1
+        for t in range(n_block):
+            heston_step(dW1[t], xi_dW2[t], *coefs, S, V)
+
+
+def _heston_lite_state(
+    S0: float,
+    V0: float,
+    n_paths: int,
+    seed: SeedLike,
+    dtype: DTypeLike,
+    backend: str,
+) -> tuple[Any, Any, Callable[..., None]]:
+    """Return initial ``(S, V)`` on ``backend`` and a matching in-place stepper."""
 
-    S = np.empty((n_paths, n_steps + 1), dtype=float)
-    V = np.empty((n_paths, n_steps + 1), dtype=float)
-    S[:, 0] = S0
-    V[:, 0] = V0
+    if backend == "numpy":
+        rng = make_rng(seed)
+        S = np.full(n_paths, S0, dtype=dtype)
+        V = np.full(n_paths, V0, dtype=dtype)
+        work = tuple(np.empty(n_paths, dtype=dtype) for _ in range(4))
+        return S, V, partial(_heston_lite_advance, S, V, rng, work=work)
+    if backend == "cupy":
+        _heston_lite_step_kernel()  # Raises a clear ImportError without CuPy.
+        import cupy as cp
 
-    for t in range(n_steps):
-        v_pos = np.maximum(V[:, t], 0.0)
-        V[:, t + 1] = V[:, t] + kappa * (theta - v_pos) * dt + xi * np.sqrt(v_pos) * dW2[:, t]
-        V[:, t + 1] = np.maximum(V[:, t + 1], 0.0)
+        rng = backend_rng(cp, seed)
+        S = cp.full(n_paths, S0, dtype=dtype)
+        V = cp.full(n_paths, V0, dtype=dtype)
+        return S, V, partial(_heston_lite_advance_cupy, S, V, rng)
+    raise ValueError("backend must be 'numpy' or 'cupy'.")
 
-        S[:, t + 1] = S[:, t] * np.exp((r - q - 0.5 * v_pos) * dt + np.sqrt(v_pos) * dW1[:, t])
 
+def simulate_heston_lite_terminal(
+    S0: float,
+    r: float,
+    q: float,
+    V0: float,
+    kappa: float,
+    theta: float,
+    xi: float,
+    rho: float,
+    T: float,
+    n_paths: int,
+    n_steps: int,
+    seed: SeedLike = None,
+    dtype: DTypeLike = np.float64,
+    backend: str = "numpy",
+) -> np.ndarray:
+    """Simulate terminal Heston-lite spots ``S_T`` without storing paths.
+
+    Same dynamics and draws as :func:`simulate_heston_lite_paths` (a given seed
+    reproduces its last column), but only the current spot and variance are
+    kept, so memory is O(n_paths) instead of O(n_paths * n_steps).
+
+    ``backend="cupy"`` runs the simulation on a CUDA device and returns a CuPy
+    array; it pays off for large ensembles (tens of thousands of paths or more).
+    """
+
+    if not (-1.0 <= rho <= 1.0):
+        raise ValueError("rho must be in [-1, 1].")
+
+    S, _, advance = _heston_lite_state(S0, V0, n_paths, seed, dtype, backend)
+    advance(r, q, kappa, theta, xi, rho, T, n_steps)
     return S
 
 
@@ -68,37 +293,51 @@ def sv_option_prices_mc(
     n_paths: int,
     n_steps_per_year: int = 252,
     option_type: str = "call",
-    seed: int | None = 42,
+    seed: SeedLike = 42,
+    dtype: DTypeLike = np.float64,
+    backend: str = "numpy",
 ) -> pd.DataFrame:
-    """Price options under Heston-lite paths for selected strikes/maturities."""
+    """Price options under Heston-lite paths for selected strikes/maturities.
+
+    One simulation serves every maturity: paths are advanced through the sorted
+    maturities, about ``n_steps_per_year`` steps per year between consecutive
+    ones, and each maturity is priced from a snapshot of the spot when reached.
+
+    Paths are simulated in ``dtype``; ``np.float32`` halves memory traffic but
+    draws a different Gaussian stream, so prices move by Monte Carlo noise.
+    Payoff means are accumulated in float64. ``backend="cupy"`` simulates on a CUDA
+    device and copies only the snapshot spots back.
+    """
+
+    if not (-1.0 <= rho <= 1.0):
+        raise ValueError("rho must be in [-1, 1].")
+    checkpoints = sorted(set(maturities))
+    if checkpoints and checkpoints[0] < 0:
+        raise ValueError("maturities must be non-negative.")
+    sign = payoff_sign(option_type)
+
+    S, _, advance = _heston_lite_state(S0, V0, n_paths, seed, dtype, backend)
+    prices_by_maturity: dict[float, list[float]] = {}
+    t_prev = 0.0
+    for maturity in checkpoints:
+        min_steps = 2 if t_prev == 0.0 else 1
+        n_steps = max(min_steps, int(round((maturity - t_prev) * n_steps_per_year)))
+        advance(r, q, kappa, theta, xi, rho, maturity - t_prev, n_steps)
+        t_prev = maturity
+
+        ST = S.get() if backend == "cupy" else S
+        # All strikes at once: one strike-major (n_strikes, n_paths) payoff matrix,
+        # so each strike's mean reduces over a contiguous row.
+        payoff = ST - np.asarray(strike_grid, dtype=ST.dtype)[:, None]
+        payoff *= sign
+        np.maximum(payoff, 0.0, out=payoff)
+
+        prices = math.exp(-r * maturity) * payoff.mean(axis=1, dtype=np.float64)
+        prices_by_maturity[maturity] = prices.tolist()
 
     rows: list[dict[str, Any]] = []
     for maturity in maturities:
-        n_steps = max(2, int(round(maturity * n_steps_per_year)))
-        paths = simulate_heston_lite_paths(
-            S0=S0,
-            r=r,
-            q=q,
-            V0=V0,
-            kappa=kappa,
-            theta=theta,
-            xi=xi,
-            rho=rho,
-            T=maturity,
-            n_paths=n_paths,
-            n_steps=n_steps,
-            seed=seed,
-        )
-        ST = paths[:, -1]
-        for K in strike_grid:
-            if option_type.lower() == "call":
-                payoff = np.maximum(ST - K, 0.0)
-            elif option_type.lower() == "put":
-                payoff = np.maximum(K - ST, 0.0)
-            else:
-                raise ValueError("option_type must be 'call' or 'put'.")
-
-            price = math.exp(-r * maturity) * float(np.mean(payoff))
+        for K, price in zip(strike_grid, prices_by_maturity[maturity]):
             rows.append(
                 {
                     "maturity": maturity,
@@ -125,21 +364,23 @@ def implied_vol_smile_from_sv_prices(
     if missing:
         raise ValueError(f"Missing required columns: {sorted(missing)}")
 
-    def _solve(row: pd.Series) -> float:
-        try:
-            return implied_vol(
-                price=float(row["price"]),
-                S=S,
-                K=float(row["strike"]),
-                r=r,
-                q=q,
-                T=float(row["maturity"]),
-                option_type=str(row["option_type"]),
-                method=method,
-            )
-        except Exception:
-            return float("nan")
+    option_type = price_table["option_type"].astype(str).str.lower()
+    is_call = (option_type == "call").to_numpy()
+    maturities = price_table["maturity"].to_numpy(dtype=float)
+    # Rows the scalar solver would reject up front stay NaN; the vectorized solver
+    # marks quotes outside no-arbitrage bounds or without convergence as NaN too.
+    valid = (is_call | (option_type == "put").to_numpy()) & (maturities > 0)
+
+    vols = np.full(len(price_table), np.nan)
+    vols[valid] = implied_vol_vec(
+        prices=price_table["price"].to_numpy(dtype=float)[valid],
+        S=S,
+        K=price_table["strike"].to_numpy(dtype=float)[valid],
+        r=r,
+        q=q,
+        T=maturities[valid],
+        is_call=is_call[valid],
+        method=method,
+    )
 
-    out = price_table.copy()
-    out["implied_vol"] = out.apply(_solve, axis=1)
-    return out
+    return price_table.assign(implied_vol=vols)
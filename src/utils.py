@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import functools
+import math
 import os
 import time
 from typing import Any, Callable, Iterable
@@ -10,12 +11,85 @@ from typing import Any, Callable, Iterable
 import numpy as np
 
 
+SeedLike = int | np.random.Generator | None
+
+_INV_SQRT_2PI = 0.3989422804014327
+_INV_SQRT_2 = 0.7071067811865476
+
+# Project-wide generator behind seed=None; set_seed replaces it.
+_RNG = np.random.default_rng()
+
+
 def set_seed(seed: int) -> None:
-    """Set NumPy's global random seed for deterministic experiments."""
+    """Seed the project generator (and NumPy's legacy global) for deterministic experiments.
 
+    Simulators called with ``seed=None`` derive their generator from this one,
+    so a single ``set_seed`` makes a whole notebook run reproducible.
+    """
+
+    global _RNG
+    _RNG = np.random.default_rng(seed)
     np.random.seed(seed)
 
 
+def make_rng(
+    seed: SeedLike = None,
+    bit_generator: Callable[[Any], np.random.BitGenerator] = np.random.PCG64,
+) -> np.random.Generator:
+    """Return a Generator for ``seed``.
+
+    A Generator is used as is (no re-seeding), an int seeds a fresh one on
+    ``bit_generator``, and ``None`` seeds one from the project generator set by
+    :func:`set_seed`. With the default PCG64 an int seed matches
+    ``np.random.default_rng(seed)``.
+    """
+
+    if isinstance(seed, np.random.Generator):
+        return seed
+    if seed is None:
+        seed = int(_RNG.integers(2**63))
+    return np.random.Generator(bit_generator(seed))
+
+
+def backend_rng(xp: Any, seed: SeedLike, bit_generator: Any = np.random.PCG64) -> Any:
+    """Return a generator on the ``xp`` backend, seeded as :func:`make_rng` would.
+
+    CuPy generators cannot wrap a host Generator, so a Generator or ``None``
+    seed is turned into an integer device seed drawn from :func:`make_rng`.
+    """
+
+    if xp is np:
+        return make_rng(seed, bit_generator)
+    if not isinstance(seed, int):
+        seed = int(make_rng(seed).integers(2**63))
+    return xp.random.default_rng(seed)
+
+
+def norm_cdf(x: float) -> float:
+    """Standard normal CDF for a Python float."""
+
+    # libm erfc keeps full relative precision in the lower tail and avoids
+    # ufunc dispatch on Python floats.
+    return 0.5 * math.erfc(-x * _INV_SQRT_2)
+
+
+def norm_pdf(x: float) -> float:
+    """Standard normal density for a Python float."""
+
+    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+
+def payoff_sign(option_type: str) -> float:
+    """Return ``+1.0`` for a call and ``-1.0`` for a put."""
+
+    kind = option_type.lower()
+    if kind == "call":
+        return 1.0
+    if kind == "put":
+        return -1.0
+    raise ValueError("option_type must be 'call' or 'put'.")
+
+
 def ensure_dirs(paths: Iterable[str]) -> None:
     """Create directories if they do not already exist."""
 
@@ -24,19 +98,29 @@ def ensure_dirs(paths: Iterable[str]) -> None:
 
 
 def to_annualized(vol_per_step: float | np.ndarray, dt: float) -> float | np.ndarray:
-    """Convert per-step volatility to annualized volatility."""
+    """Convert per-step volatility to annualized volatility.
+
+    Scalars stay Python floats; array-likes come back as arrays.
+    """
 
     if dt <= 0:
         raise ValueError("dt must be positive.")
-    return np.asarray(vol_per_step) / np.sqrt(dt)
+    if isinstance(vol_per_step, (int, float)):
+        return vol_per_step / math.sqrt(dt)
+    return np.asarray(vol_per_step) / math.sqrt(dt)
 
 
 def to_step_vol(vol_annualized: float | np.ndarray, dt: float) -> float | np.ndarray:
-    """Convert annualized volatility to per-step volatility."""
+    """Convert annualized volatility to per-step volatility.
+
+    Scalars stay Python floats; array-likes come back as arrays.
+    """
 
     if dt <= 0:
         raise ValueError("dt must be positive.")
-    return np.asarray(vol_annualized) * np.sqrt(dt)
+    if isinstance(vol_annualized, (int, float)):
+        return vol_annualized * math.sqrt(dt)
+    return np.asarray(vol_annualized) * math.sqrt(dt)
 
 
 def assert_close(a: float, b: float, tol: float, msg: str = "") -> None:
@@ -48,7 +132,11 @@ def assert_close(a: float, b: float, tol: float, msg: str = "") -> None:
 
 
 def timed(func: Callable[..., Any]) -> Callable[..., Any]:
-    """Decorator that returns function output and runtime in seconds."""
+    """Decorator that returns function output and runtime in seconds.
+
+    A returned dict gets ``runtime_seconds`` added in place (unless already set)
+    rather than being copied; any other result is returned as ``(result, runtime)``.
+    """
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -56,7 +144,6 @@ def timed(func: Callable[..., Any]) -> Callable[..., Any]:
         result = func(*args, **kwargs)
         runtime = time.perf_counter() - start
         if isinstance(result, dict):
-            result = dict(result)
             result.setdefault("runtime_seconds", runtime)
             return result
         return result, runtime
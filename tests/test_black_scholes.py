@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
-from src.black_scholes import bs_call_price, bs_delta, bs_put_price, put_call_parity_check
+from src.black_scholes import (
+    bs_call_price,
+    bs_delta,
+    bs_price,
+    bs_price_vega,
+    bs_put_price,
+    bs_vega,
+    put_call_parity_check,
+)
 
 
 def test_put_call_parity_close() -> None:
@@ -21,3 +29,10 @@ def test_delta_sign_sanity() -> None:
     assert 0 < call_delta < 1
     assert -1 < put_delta < 0
     assert bs_put_price(S=100, K=100, r=0.02, q=0.00, sigma=0.2, T=1.0) > 0
+
+
+def test_price_vega_bundle_matches_individual_calls() -> None:
+    for option_type in ["call", "put"]:
+        price, vega = bs_price_vega(S=100, K=110, r=0.02, q=0.01, sigma=0.25, T=0.5, option_type=option_type)
+        assert abs(price - bs_price(100, 110, 0.02, 0.01, 0.25, 0.5, option_type)) < 1e-12
+        assert abs(vega - bs_vega(100, 110, 0.02, 0.01, 0.25, 0.5)) < 1e-12
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from src.hedging import simulate_delta_hedge_gbm
+import pytest
+
+from src.hedging import hedging_experiment_grid, simulate_delta_hedge_gbm, simulate_delta_hedge_on_paths
+from src.processes import simulate_gbm_path_exact
 
 
 def test_more_frequent_rebalancing_reduces_error_std_without_costs() -> None:
@@ -67,3 +70,29 @@ def test_transaction_costs_reduce_short_hedged_book_pnl() -> None:
         seed=123,
     )
     assert with_cost["mean_error"] < without_cost["mean_error"]
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_grid_cost_rows_match_single_cost_runs(option_type: str) -> None:
+    market = dict(S0=100.0, r=0.02, q=0.01, sigma=0.25, T=0.5, n_paths=1_500, n_steps=60)
+    tx_costs = [0.0, 0.001, 0.01]
+    grid = hedging_experiment_grid(
+        K=105.0, **market, rebalance_list=[1, 7], tx_cost_list=tx_costs, option_type=option_type, seed=8
+    )
+    paths = simulate_gbm_path_exact(**market, seed=8)
+
+    assert len(grid) == 6
+    for row in grid.itertuples(index=False):
+        single = simulate_delta_hedge_on_paths(
+            paths,
+            K=105.0,
+            r=market["r"],
+            q=market["q"],
+            sigma_model=market["sigma"],
+            T=market["T"],
+            rebalance_every_k_steps=row.rebalance_every_k_steps,
+            option_type=option_type,
+            tx_cost_per_dollar=row.tx_cost_per_dollar,
+        )
+        for col in ("mean_error", "std_error", "q05", "q95"):
+            assert getattr(row, col) == pytest.approx(single[col], rel=1e-12, abs=1e-12)
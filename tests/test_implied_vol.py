@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from src.black_scholes import bs_call_price
-from src.implied_vol import implied_vol
+import numpy as np
+
+from src.black_scholes import bs_call_price, bs_price
+from src.implied_vol import implied_vol, implied_vol_vec
 
 
 def test_recover_sigma_from_synthetic_prices() -> None:
@@ -21,3 +23,17 @@ def test_recover_sigma_from_synthetic_prices() -> None:
             option_type="call",
         )
         assert abs(sigma_hat - sigma_true) < 1e-6
+
+
+def test_vectorized_inversion_matches_scalar_solver() -> None:
+    strikes = np.array([80.0, 100.0, 120.0, 90.0, 110.0])
+    is_call = np.array([True, True, True, False, False])
+    sigma_true = np.array([0.30, 0.24, 0.20, 0.28, 0.22])
+    prices = np.array(
+        [
+            bs_price(S=100.0, K=k, r=0.02, q=0.01, sigma=s, T=0.5, option_type="call" if c else "put")
+            for k, s, c in zip(strikes, sigma_true, is_call)
+        ]
+    )
+    sigma_hat = implied_vol_vec(prices=prices, S=100.0, K=strikes, r=0.02, q=0.01, T=0.5, is_call=is_call)
+    assert np.max(np.abs(sigma_hat - sigma_true)) < 1e-6
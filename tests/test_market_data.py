@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import sys
+import types
+
 import pandas as pd
 import pytest
 
-from src.market_data import assert_price_data_ready, price_data_quality_report, price_gap_report
+from src import market_data
+from src.market_data import (
+    assert_price_data_ready,
+    clear_download_cache,
+    fetch_prices_yfinance,
+    price_data_quality_report,
+    price_gap_report,
+)
 
 
 def _sample_prices() -> pd.DataFrame:
@@ -53,3 +63,39 @@ def test_assert_price_data_ready_fails_for_late_start() -> None:
     prices = pd.DataFrame({"ASML": [100.0, 101.0, 102.0, 103.0]}, index=idx)
     with pytest.raises(ValueError, match="starts too late"):
         assert_price_data_ready(prices, ticker="ASML", start="2020-01-01", min_obs=3, max_gap_days=5)
+
+
+def test_failed_download_is_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    responses = [pd.DataFrame(), _sample_prices().rename(columns={"ASML": "Close"})]
+    calls = []
+
+    def fake_download(**kwargs: object) -> pd.DataFrame:
+        calls.append(kwargs)
+        return responses[min(len(calls), len(responses)) - 1]
+
+    monkeypatch.setitem(sys.modules, "yfinance", types.SimpleNamespace(download=fake_download))
+    monkeypatch.setattr(market_data, "_DOWNLOAD_CACHE", {})
+
+    args = (["ASML"], "2020-01-01", "2020-02-01")
+    assert fetch_prices_yfinance(*args).empty
+    first_ok = fetch_prices_yfinance(*args)
+    second_ok = fetch_prices_yfinance(*args)
+
+    assert len(calls) == 2
+    assert list(first_ok.columns) == ["ASML"]
+    pd.testing.assert_frame_equal(first_ok, second_ok)
+
+    clear_download_cache()
+    fetch_prices_yfinance(*args)
+    assert len(calls) == 3
+
+
+def test_extract_close_falls_back_when_close_level_is_unused() -> None:
+    idx = pd.to_datetime(["2020-01-02", "2020-01-03"])
+    columns = pd.MultiIndex.from_product([["Close", "Adj Close"], ["ASML", "NVDA"]])
+    data = pd.DataFrame([[1.0, 2.0, 3.0, 4.0], [5.0, 6.0, 7.0, 8.0]], index=idx, columns=columns)
+    data = data.drop(columns="Close", level=0)
+    assert "Close" in data.columns.levels[0]
+
+    close = market_data._extract_close_prices(data, tickers=["ASML", "NVDA"])
+    assert close.to_numpy().tolist() == [[3.0, 4.0], [7.0, 8.0]]
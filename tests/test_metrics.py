@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 
 from src.metrics import cvar, max_drawdown
 
@@ -18,3 +19,38 @@ def test_cvar_toy_distribution() -> None:
     values = np.array([-4.0, -3.0, -2.0, 1.0, 2.0, 3.0])
     tail = cvar(values, alpha=0.2)
     assert tail <= -3.0
+
+
+def _cvar_quantile_reference(values: np.ndarray, alpha: float) -> float:
+    """The original np.quantile-based definition."""
+
+    arr = np.asarray(values, dtype=float)
+    tail = arr[arr <= np.quantile(arr, alpha)]
+    return float(tail.mean()) if tail.size else float("nan")
+
+
+@pytest.mark.parametrize("alpha", [0.0, 0.05, 0.2, 0.5, 0.95, 1.0])
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1.5],
+        [2.0, -1.0],
+        [0.3, -0.2, 0.1],
+        [-1.0, -1.0, -1.0, 2.0, 2.0],
+        [0.0, 0.0, 0.0, 0.0],
+        [-3.0, -1.0, -1.0, -1.0, 0.5, 0.5, 4.0, -3.0],
+        list(np.round(np.random.default_rng(0).standard_normal(101), 1)),
+        [0.1, np.nan, -0.4, 0.2],
+        [np.nan, np.nan],
+    ],
+    ids=["n1", "n2", "n3", "ties", "constant", "ties_both_sides", "rounded_normal", "nan", "all_nan"],
+)
+def test_cvar_matches_quantile_definition(values: list[float], alpha: float) -> None:
+    expected = _cvar_quantile_reference(np.array(values), alpha)
+    np.testing.assert_allclose(cvar(np.array(values), alpha=alpha), expected, rtol=1e-12, equal_nan=True)
+
+
+@pytest.mark.parametrize("alpha", [-0.1, 1.5])
+def test_cvar_rejects_alpha_outside_unit_interval(alpha: float) -> None:
+    with pytest.raises(ValueError, match="alpha"):
+        cvar(np.array([-3.0, -1.0, 0.0, 2.0, 5.0]), alpha=alpha)
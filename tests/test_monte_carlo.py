@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import Any
+
 import numpy as np
+import pytest
 
 from src.black_scholes import bs_call_price
-from src.monte_carlo import mc_price_european_gbm_terminal
-from src.processes import simulate_gbm_exact
+from src.monte_carlo import (
+    mc_control_variate_with_terminal_asset,
+    mc_price_european_gbm_path_euler,
+    mc_price_european_gbm_terminal,
+)
+from src.processes import simulate_gbm_exact, sobol_brownian_increments
+from src.utils import set_seed
 
 
 def test_mc_price_within_three_standard_errors_of_bs() -> None:
@@ -32,3 +41,40 @@ def test_exact_gbm_terminal_mean_matches_theory() -> None:
     empirical = float(np.mean(paths))
     theoretical = S0 * np.exp((r - q) * T)
     assert abs(empirical - theoretical) / theoretical < 0.01
+
+
+def test_sobol_bridge_increments_are_independent_gaussians() -> None:
+    dW = sobol_brownian_increments(n_paths=4096, n_steps=12, dt=0.25, seed=7)
+    assert np.allclose(dW.mean(axis=0), 0.0, atol=1e-3)
+    assert np.allclose(np.cov(dW.T), 0.25 * np.eye(12), atol=5e-3)
+
+
+def test_sobol_path_mc_is_tighter_than_pseudo() -> None:
+    bs = bs_call_price(S=100.0, K=100.0, r=0.02, q=0.0, sigma=0.2, T=1.0)
+    kwargs = dict(S0=100.0, K=100.0, r=0.02, q=0.0, sigma=0.2, T=1.0, n_paths=4096, n_steps=16, option_type="call")
+    sobol = [mc_price_european_gbm_path_euler(**kwargs, seed=s, sampler="sobol")["price"] for s in range(5)]
+    pseudo = [mc_price_european_gbm_path_euler(**kwargs, seed=s)["price"] for s in range(5)]
+    assert abs(float(np.mean(sobol)) - bs) < 0.05
+    assert np.std(sobol) < 0.2 * np.std(pseudo)
+
+
+@pytest.mark.parametrize(
+    "pricer, extra",
+    [
+        (mc_price_european_gbm_terminal, {}),
+        (mc_price_european_gbm_path_euler, {"n_steps": 8}),
+        (mc_price_european_gbm_path_euler, {"n_steps": 8, "sampler": "sobol"}),
+        (mc_control_variate_with_terminal_asset, {}),
+    ],
+)
+def test_mc_pricers_honour_generator_and_set_seed(pricer: Callable[..., dict[str, Any]], extra: dict[str, Any]) -> None:
+    kwargs = dict(S0=100.0, K=100.0, r=0.02, q=0.0, sigma=0.2, T=1.0, n_paths=2_048, option_type="call", **extra)
+
+    set_seed(11)
+    first = pricer(**kwargs)["price"]
+    set_seed(11)
+    assert pricer(**kwargs)["price"] == first
+
+    rng = np.random.default_rng(5)
+    from_generator = pricer(**kwargs, seed=rng)["price"]
+    assert pricer(**kwargs, seed=rng)["price"] != from_generator  # the stream advanced
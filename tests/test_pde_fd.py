@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from src.black_scholes import bs_call_price
 from src.pde_fd import fd_price_european_bs
 
@@ -22,3 +24,12 @@ def test_fd_price_close_to_bs() -> None:
         scheme="CN",
     )
     assert abs(out["price"] - bs) < 2e-2
+
+
+@pytest.mark.parametrize("scheme, expected", [("CN", 2.9412690200805), ("implicit", 2.9356548893761)])
+def test_fd_smallest_grid_solves(scheme: str, expected: float) -> None:
+    # M=3 leaves a 2x2 interior system; values from the pre-LAPACK Thomas solver.
+    out = fd_price_european_bs(
+        S0=100.0, K=100.0, r=0.02, q=0.0, sigma=0.2, T=1.0, option_type="call", S_max=300.0, M=3, N=10, scheme=scheme
+    )
+    assert out["price"] == pytest.approx(expected, rel=1e-12)
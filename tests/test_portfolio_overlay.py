@@ -0,0 +1,42 @@
+"""Tests for the protective-put overlay."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.metrics import summary_table
+from src.portfolio_overlay import protective_put_overlay_grid, protective_put_overlay_simulation
+
+MARKET = dict(S0=100.0, r=0.02, q=0.01, sigma=0.25, T_sim=1.0, notional=1_000_000.0, n_paths=2_000, n_steps=52)
+
+
+def test_overlay_grid_matches_single_simulations() -> None:
+    grid = protective_put_overlay_grid(
+        **MARKET,
+        K_put_list=[85.0, 95.0],
+        T_put_list=[0.5, 1.0],
+        premium_budget_fraction_list=[0.01, 0.03],
+        seed=3,
+    )
+    assert len(grid) == 8
+
+    for row in grid.itertuples(index=False):
+        single = protective_put_overlay_simulation(
+            **MARKET,
+            K_put=row.K_put,
+            T_put=row.T_put,
+            premium_budget_fraction=row.premium_budget_fraction,
+            seed=3,
+        )
+        expected = summary_table(single["hedged_returns"]).iloc[0]
+        assert row.hedge_units == pytest.approx(single["hedge_units"])
+        assert row.premium_paid == pytest.approx(single["premium_paid"])
+        for col, value in expected.items():
+            assert getattr(row, col) == pytest.approx(value)
+
+
+def test_overlay_grid_rejects_empty_lists() -> None:
+    with pytest.raises(ValueError, match="must be non-empty"):
+        protective_put_overlay_grid(
+            **MARKET, K_put_list=[90.0], T_put_list=[], premium_budget_fraction_list=[0.02]
+        )
@@ -0,0 +1,32 @@
+"""Tests for the SDE step-count experiment."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from src.sde import error_vs_step_count_experiment
+
+
+def test_divisor_step_counts_share_one_brownian_path() -> None:
+    table = error_vs_step_count_experiment(
+        S0=100.0, r=0.05, q=0.0, sigma=0.3, T=1.0, n_paths=4_000, step_counts=[1, 2, 4, 8, 16, 3], seed=5
+    ).set_index("n_steps")
+
+    # Exact GBM only sees W_T, which coarse grids inherit from the fine path.
+    coupled = table.loc[[1, 2, 4, 8, 16], "exact_mean_ST"].to_numpy()
+    np.testing.assert_allclose(coupled, coupled[0], rtol=1e-12)
+    # 3 does not divide 16, so it draws its own block.
+    assert abs(table.loc[3, "exact_mean_ST"] - coupled[0]) > 1e-6
+
+
+def test_euler_error_shrinks_with_step_count_under_common_shocks() -> None:
+    S0, r, T = 100.0, 0.3, 1.0
+    table = error_vs_step_count_experiment(
+        S0=S0, r=r, q=0.0, sigma=0.3, T=T, n_paths=20_000, step_counts=[1, 2, 4, 8, 16, 64], seed=1
+    )
+
+    # Antithetic pairs cancel the one-step shock exactly: E[S_T] = S0 (1 + r T).
+    assert np.isclose(table.loc[0, "euler_mean_ST"], S0 * (1.0 + r * T), rtol=1e-12)
+    # Euler and exact share shocks, so their gap is discretization bias and shrinks monotonically.
+    gap = (table["euler_mean_ST"] - table["exact_mean_ST"]).abs().to_numpy()
+    assert np.all(np.diff(gap) < 0)
@@ -0,0 +1,80 @@
+"""Tests for the Heston-lite stochastic-volatility simulator."""
+
+from __future__ import annotations
+
+import importlib.util
+import math
+
+import numpy as np
+import pytest
+
+from src.stoch_vol import simulate_heston_lite_paths, simulate_heston_lite_terminal, sv_option_prices_mc
+
+HESTON = dict(S0=100.0, r=0.02, q=0.01, V0=0.04, kappa=2.0, theta=0.05, xi=0.6, rho=-0.7)
+STRIKES = [80.0, 100.0, 120.0]
+
+
+def _per_maturity_prices(maturity: float, option_type: str, n_paths: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Price one maturity from its own simulation; return (prices, standard errors)."""
+
+    n_steps = max(2, round(maturity * 252))
+    ST = simulate_heston_lite_terminal(**HESTON, T=maturity, n_paths=n_paths, n_steps=n_steps, seed=seed)
+    sign = 1.0 if option_type == "call" else -1.0
+    payoff = np.maximum(sign * (ST[None, :] - np.array(STRIKES)[:, None]), 0.0) * math.exp(-HESTON["r"] * maturity)
+    return payoff.mean(axis=1), payoff.std(axis=1, ddof=1) / math.sqrt(n_paths)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("n_paths", [5, 8193])
+def test_terminal_simulator_matches_last_path_column(n_paths: int, dtype: type) -> None:
+    paths = simulate_heston_lite_paths(**HESTON, T=1.0, n_paths=n_paths, n_steps=40, seed=9, dtype=dtype)
+    terminal = simulate_heston_lite_terminal(**HESTON, T=1.0, n_paths=n_paths, n_steps=40, seed=9, dtype=dtype)
+
+    assert paths.shape == (n_paths, 41)
+    assert paths.flags.c_contiguous
+    assert terminal.dtype == dtype
+    np.testing.assert_array_equal(terminal, paths[:, -1])
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_sv_prices_single_pass_agrees_with_per_maturity_pricing(option_type: str) -> None:
+    maturities = [1.0, 0.25, 0.5, 0.25]
+    n_paths = 20_000
+    table = sv_option_prices_mc(STRIKES, maturities, **HESTON, n_paths=n_paths, option_type=option_type, seed=4)
+
+    assert table["maturity"].tolist() == [m for m in maturities for _ in STRIKES]
+    assert table["strike"].tolist() == STRIKES * len(maturities)
+    assert (table["option_type"] == option_type).all()
+    prices = table["price"].to_numpy().reshape(len(maturities), len(STRIKES))
+    np.testing.assert_array_equal(prices[1], prices[3])
+
+    # The first checkpoint is a plain simulation from t=0, so it matches exactly.
+    first, _ = _per_maturity_prices(0.25, option_type, n_paths, seed=4)
+    np.testing.assert_allclose(prices[1], first, rtol=1e-12)
+
+    # Later maturities continue the same paths; independent runs agree within MC error.
+    for row, maturity in zip(prices, maturities):
+        reference, std_error = _per_maturity_prices(maturity, option_type, n_paths, seed=99)
+        assert np.all(np.abs(row - reference) < 4.0 * math.sqrt(2.0) * std_error + 1e-12)
+
+
+def test_sv_prices_do_not_depend_on_maturity_order() -> None:
+    shuffled = sv_option_prices_mc(STRIKES, [0.5, 0.25, 1.0], **HESTON, n_paths=2_000, seed=1)
+    ordered = sv_option_prices_mc(STRIKES, [0.25, 0.5, 1.0], **HESTON, n_paths=2_000, seed=1)
+
+    ordered = ordered.set_index(["maturity", "strike"]).loc[shuffled.set_index(["maturity", "strike"]).index]
+    np.testing.assert_array_equal(shuffled["price"].to_numpy(), ordered["price"].to_numpy())
+
+
+def test_sv_prices_float32_agree_within_mc_error() -> None:
+    n_paths = 20_000
+    single = sv_option_prices_mc(STRIKES, [0.5], **HESTON, n_paths=n_paths, seed=2, dtype=np.float32)
+    reference, std_error = _per_maturity_prices(0.5, "call", n_paths, seed=2)
+    # float32 Gaussians come from a different stream, so compare at MC-noise level.
+    assert np.all(np.abs(single["price"].to_numpy() - reference) < 4.0 * math.sqrt(2.0) * std_error)
+
+
+@pytest.mark.skipif(importlib.util.find_spec("cupy") is not None, reason="CuPy is installed.")
+def test_cupy_backend_without_cupy_raises_install_hint() -> None:
+    with pytest.raises(ImportError, match="Install cupy"):
+        simulate_heston_lite_terminal(**HESTON, T=1.0, n_paths=4, n_steps=2, backend="cupy")
@@ -0,0 +1,21 @@
+"""Tests for shared utilities."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from src.utils import make_rng, set_seed
+
+
+def test_make_rng_none_follows_set_seed() -> None:
+    set_seed(123)
+    first = make_rng(None).standard_normal(5)
+    set_seed(123)
+    second = make_rng(None).standard_normal(5)
+    np.testing.assert_array_equal(first, second)
+
+
+def test_make_rng_passes_generator_through() -> None:
+    rng = np.random.default_rng(7)
+    assert make_rng(rng) is rng
+    np.testing.assert_array_equal(make_rng(7).standard_normal(5), np.random.default_rng(7).standard_normal(5))